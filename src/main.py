@@ -42,13 +42,24 @@
 """
 from __future__ import annotations
 
+import array
+import bisect
+from collections import OrderedDict
 from pathlib import Path
+import csv
+import functools
+import hashlib
 import logging
+import os
+import pickle
+import re
 import sys
+import tempfile
+import threading
 import argparse
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple
 
-import difflib
+import numpy as np
 import pandas as pd
 from PyQt6.QtCore import (
     Qt,
@@ -56,10 +67,13 @@ from PyQt6.QtCore import (
     pyqtSignal,
     QObject,
     QEvent,
+    QRunnable,
     QSize,
+    QThreadPool,
 )
 from PyQt6.QtGui import (
     QPixmap,
+    QImage,
     QImageReader,
     QPalette,
     QColor,
@@ -101,9 +115,18 @@ DEBUG_MODE = False  # Включить подробное логирование
 MIN_SUGGESTIONS = 1
 MAX_SUGGESTIONS = 7
 DEBOUNCE_MS = 150
+RESIZE_DEBOUNCE_MS = 40  # Дебаунс тяжёлого пересчёта при ресайзе окна
+AUTOSAVE_FLUSH_MS = 2000  # Отложенная запись автосохранения на диск
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp"}
+# Те же расширения без точки — для фильтрации по имени из os.scandir
+IMAGE_EXT_SUFFIXES = frozenset(ext.lstrip(".") for ext in IMAGE_EXTENSIONS)
 LOG_FILE = "app.log"
 TAG_DB_CSV = Path("derpibooru.csv")
+TAG_DB_CACHE = TAG_DB_CSV.with_suffix(".cache.pkl")
+CSV_MAX_FIELD_LEN = 4096  # Поле длиннее — признак битого экранирования в CSV
+TEXT_CACHE_MAX = 512  # Максимум записей в кэше текста (LRU-вытеснение)
+PIXMAP_CACHE_MAX = 8  # Максимум декодированных изображений в памяти (LRU)
+TAG_CACHE_MAX = 1024  # Максимум запросов в кэше подсказок (LRU-вытеснение)
 DESCRIPTION_SEPARATOR = "###DESCRIPTION###"  # Разделитель между тегами и описанием
 
 # Пороги разрешения для автоматических тегов (в пикселях)
@@ -112,6 +135,47 @@ DESCRIPTION_SEPARATOR = "###DESCRIPTION###"  # Разделитель между
 # - absurd resolution: ≥ 16 мегапикселей (4000×4000px)
 HIGH_RES_THRESHOLD = 4_000_000  # 4 мегапикселя (2000×2000)
 ABSURD_RES_THRESHOLD = 16_000_000  # 16 мегапикселей (4000×4000)
+# Тег по числу пройденных порогов: 0 — без тега, 1 — high res, 2 — absurd
+_RES_TAGS = (None, "high res", "absurd resolution")
+
+# Количественные теги — общие для подсветки ввода, подсказок и реордеринга
+QUANTITY_TAGS = frozenset({'solo', 'duo', 'trio', 'group', 'crowd'})
+
+# Видовые теги для пони/MLP
+SPECIES_TAGS = frozenset({
+    # Основные виды пони
+    'pony', 'earth pony', 'pegasus', 'unicorn', 'alicorn', 'bat pony',
+    # Другие виды
+    'dragon', 'griffon', 'griffin', 'changeling', 'zebra', 'donkey', 'mule',
+    'hippogriff', 'seapony', 'kirin', 'yak', 'buffalo', 'minotaur',
+    # Общие категории
+    'anthro', 'human', 'humanized', 'robot', 'cyborg',
+    # Дополнительные варианты написания
+    'earth_pony', 'bat_pony', 'sea_pony'
+})
+# Варианты написания (пробелы/подчеркивания) развёрнуты один раз при импорте —
+# проверка тега сводится к поиску в хеш-множестве
+SPECIES_TAG_VARIANTS = frozenset(
+    variant
+    for species in SPECIES_TAGS
+    for variant in (species, species.replace('_', ' '), species.replace(' ', '_'))
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def is_species_tag(tag: str) -> bool:
+    """Проверить, является ли тег (в нижнем регистре) видовым.
+
+    Результат мемоизируется: наборы тегов сильно повторяются между
+    изображениями одной папки, и на повторах исчезает даже нормализация
+    плюсов.
+    """
+    # Варианты с пробелами/подчеркиваниями уже развёрнуты в константе
+    if tag in SPECIES_TAG_VARIANTS:
+        return True
+
+    # Плюсы нормализуются к пробелам, как при отображении
+    return '+' in tag and tag.replace('+', ' ') in SPECIES_TAG_VARIANTS
 
 # Стиль — вынесен в константу для удобства правок
 APP_STYLESHEET = """
@@ -128,7 +192,6 @@ QStatusBar { color: #ffffff; background-color: #3c3f41; }
 
 
 # --------------------------- Централизованная система логирования ---------------------------
-import functools
 import traceback
 import time
 from typing import Any, Callable, TypeVar
@@ -186,6 +249,12 @@ class DetailedLogger:
         """Отладочное сообщение (только в DEBUG_MODE)."""
         if self.debug_mode:
             self.logger.debug(msg, *args, **kwargs)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Проверка уровня до построения дорогих аргументов сообщения."""
+        if level <= logging.DEBUG and not self.debug_mode:
+            return False
+        return self.logger.isEnabledFor(level)
     
     def info(self, msg: str, *args, **kwargs):
         """Информационное сообщение."""
@@ -256,7 +325,7 @@ def log_user_action(action_name: str = None):
             except Exception as e:
                 # Логируем ошибку
                 duration = time.time() - start_time
-                logger.error(f"USER_ACTION: {action} FAILED after {duration:.3f}s - {str(e)}")
+                logger.error("USER_ACTION: %s FAILED after %.3fs - %s", action, duration, e)
                 
                 if DEBUG_MODE:
                     logger.exception(f"Detailed error in {action}")
@@ -278,7 +347,7 @@ def safe_execute(operation_name: str, default_return=None):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(f"SAFE_EXECUTE: {operation_name} failed - {str(e)}")
+                logger.error("SAFE_EXECUTE: %s failed - %s", operation_name, e)
                 if DEBUG_MODE:
                     logger.exception(f"Detailed error in {operation_name}")
                 return default_return
@@ -321,22 +390,6 @@ class TagHighlighter(QSyntaxHighlighter):
         self.species_format = QTextCharFormat()
         self.species_format.setBackground(QBrush(QColor(186, 104, 200, 102)))  # #BA68C8 с 40% прозрачности
         
-        # Определяем видовые теги
-        self.species_tags = {
-            # Основные виды пони
-            'pony', 'earth pony', 'pegasus', 'unicorn', 'alicorn', 'bat pony',
-            # Другие виды
-            'dragon', 'griffon', 'griffin', 'changeling', 'zebra', 'donkey', 'mule',
-            'hippogriff', 'seapony', 'kirin', 'yak', 'buffalo', 'minotaur',
-            # Общие категории
-            'anthro', 'human', 'humanized', 'robot', 'cyborg',
-            # Дополнительные варианты написания
-            'earth_pony', 'bat_pony', 'sea_pony'
-        }
-        
-        # Количественные теги
-        self.quantity_tags = {'solo', 'duo', 'trio', 'group', 'crowd'}
-    
     def highlightBlock(self, text):
         """Основная функция подсветки блока текста."""
         if not text.strip():
@@ -365,7 +418,7 @@ class TagHighlighter(QSyntaxHighlighter):
                 self.setFormat(tag_start, len(tag), self.artist_format)
             elif tag_lower.startswith('oc:'):
                 self.setFormat(tag_start, len(tag), self.oc_format)
-            elif tag_lower in self.quantity_tags:
+            elif tag_lower in QUANTITY_TAGS:
                 self.setFormat(tag_start, len(tag), self.quantity_format)
             elif self._is_species_tag(tag_lower):
                 self.setFormat(tag_start, len(tag), self.species_format)
@@ -378,21 +431,7 @@ class TagHighlighter(QSyntaxHighlighter):
     
     def _is_species_tag(self, tag: str) -> bool:
         """Проверить, является ли тег видовым."""
-        # Проверяем точное совпадение
-        if tag in self.species_tags:
-            return True
-        
-        # Проверяем варианты с подчеркиваниями и пробелами
-        tag_normalized = tag.replace('_', ' ').replace('+', ' ')
-        if tag_normalized in self.species_tags:
-            return True
-        
-        # Проверяем обратное преобразование
-        tag_with_underscores = tag.replace(' ', '_')
-        if tag_with_underscores in self.species_tags:
-            return True
-        
-        return False
+        return is_species_tag(tag)
 
 
 # --------------------------- Виджеты ---------------------------
@@ -498,9 +537,8 @@ class ClickableImageLabel(QLabel):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         # Более консервативный базовый минимум, чтобы не заставлять окно расти
         self.setMinimumSize(200, 150)
-        # Рамка вокруг превью; уменьшили padding, чтобы картинка могла занять больше площади
-        self.setStyleSheet("border: 3px dashed #6b6b6b; border-radius: 12px; padding: 8px; background-clip: padding-box;")
-        # Лёгкая рамка, чтобы обозначить область дропа
+        # Лёгкая рамка, чтобы обозначить область дропа (один setStyleSheet —
+        # каждый вызов заставляет Qt заново парсить QSS)
         self.setStyleSheet("border: 2px dashed #666; border-radius: 8px;")
 
         self.loading_label = QLabel("Loading...", self)
@@ -567,30 +605,41 @@ class ClickOutsideFilter(QObject):
         super().__init__(parent_window)
         self.window = parent_window
 
+    # Интересующие типы событий — кэшируем на уровне класса, чтобы не
+    # создавать кортеж при каждом событии Qt
+    _WATCHED_TYPES = frozenset(
+        {QEvent.Type.MouseButtonPress, QEvent.Type.FocusOut}
+    )
+
     def eventFilter(self, watched, event):  # pragma: no cover - GUI
+        # Ранний выход: фильтр вызывается для каждого события приложения,
+        # поэтому нерелевантные типы отбрасываем до любой другой работы
+        etype = event.type()
+        if etype not in self._WATCHED_TYPES:
+            return False
+
         # Обрабатываем клики мыши и потерю фокуса
-        if event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.FocusOut):
-            if self.window.suggestions_list.isVisible():
-                if event.type() == QEvent.Type.MouseButtonPress:
-                    global_pos = event.globalPosition().toPoint()
-                else:
-                    global_pos = None
+        if self.window.suggestions_list.isVisible():
+            if etype == QEvent.Type.MouseButtonPress:
+                global_pos = event.globalPosition().toPoint()
+            else:
+                global_pos = None
 
-                if global_pos is None:
-                    self.window.hide_suggestions()
-                    return False
+            if global_pos is None:
+                self.window.hide_suggestions()
+                return False
 
-                inside_input = self.window.tag_input.geometry().contains(
-                    self.window.tag_input.mapFromGlobal(global_pos)
-                )
-                inside_suggestions = self.window.suggestions_list.geometry().contains(
-                    self.window.suggestions_list.mapFromGlobal(global_pos)
-                )
-                if not inside_input and not inside_suggestions:
-                    if DEBUG_MODE:
-                        logger.debug("Click outside detected: hiding suggestions")
-                    self.window.hide_suggestions()
-        return super().eventFilter(watched, event)
+            inside_input = self.window.tag_input.geometry().contains(
+                self.window.tag_input.mapFromGlobal(global_pos)
+            )
+            inside_suggestions = self.window.suggestions_list.geometry().contains(
+                self.window.suggestions_list.mapFromGlobal(global_pos)
+            )
+            if not inside_input and not inside_suggestions:
+                if DEBUG_MODE:
+                    logger.debug("Click outside detected: hiding suggestions")
+                self.window.hide_suggestions()
+        return False
 
 
 class ImageWheelFilter(QObject):
@@ -601,15 +650,106 @@ class ImageWheelFilter(QObject):
         self.window = parent_window
 
     def eventFilter(self, watched, event):  # pragma: no cover - GUI
-        if event.type() == QEvent.Type.Wheel:
-            delta = event.angleDelta().y()
-            logger.debug(f"Wheel event detected: delta={delta}")
-            if delta > 0:
-                self.window.show_prev_image()
-            elif delta < 0:
-                self.window.show_next_image()
-            return True
-        return super().eventFilter(watched, event)
+        # Ранний выход для всех событий кроме прокрутки
+        if event.type() != QEvent.Type.Wheel:
+            return False
+        delta = event.angleDelta().y()
+        if DEBUG_MODE:
+            logger.debug("Wheel event detected: delta=%d", delta)
+        if delta > 0:
+            self.window.show_prev_image()
+        elif delta < 0:
+            self.window.show_next_image()
+        return True
+
+
+class ImagePrefetchTask(QRunnable):
+    """Фоновое декодирование изображения для кэша превью.
+
+    Тяжёлая часть (чтение и декодирование в QImage) выполняется в пуле
+    потоков; конвертация в QPixmap и запись в кэш происходят в GUI-потоке
+    через сигнал окна, как того требует Qt.
+    """
+
+    def __init__(self, window: "TagAutoCompleteApp", path: Path):
+        super().__init__()
+        self.window = window
+        self.path = path
+        self.setAutoDelete(True)
+
+    def run(self):  # pragma: no cover - фоновый поток
+        try:
+            reader = QImageReader(str(self.path))
+            reader.setAutoTransform(True)
+            image = reader.read()
+        except Exception as exc:
+            logger.debug("Prefetch failed for %s: %s", self.path, exc)
+            image = QImage()
+        try:
+            # Сигнал уходит и при неудачном декодировании (пустой QImage):
+            # GUI-поток должен снять путь с учёта _prefetch_pending, иначе
+            # файл, не прочитавшийся с первого раза, навсегда исключается
+            # из повторных попыток префетча
+            self.window.imagePrefetched.emit(str(self.path), image)
+        except RuntimeError:
+            pass  # окно уже уничтожено
+
+
+class SuggestionSearchTask(QRunnable):
+    """Фоновый поиск подсказок для одного запроса.
+
+    Сам поиск выполняется в пуле потоков, чтобы не блокировать цикл
+    событий Qt на медленных машинах; результат возвращается в GUI-поток
+    сигналом окна вместе с номером поколения, по которому устаревшие
+    ответы отбрасываются.
+    """
+
+    def __init__(self, window: "TagAutoCompleteApp", query: str, generation: int):
+        super().__init__()
+        self.window = window
+        self.query = query
+        self.generation = generation
+        self.setAutoDelete(True)
+
+    def run(self):  # pragma: no cover - фоновый поток
+        try:
+            suggestions = self.window.find_suggestions(self.query)
+            self.window.suggestionsReady.emit(self.generation, self.query, suggestions)
+        except Exception as exc:
+            logger.debug("Suggestion search failed for '%s': %s", self.query, exc)
+
+
+# Кэш подсказок мутируют и рабочие потоки пула (find_suggestions внутри
+# SuggestionSearchTask), и GUI-поток (синхронный путь update_suggestions):
+# move_to_end после конкурентного вытеснения без блокировки падал бы с
+# KeyError. Мутации короткие, поэтому одного глобального замка достаточно
+_TAG_CACHE_LOCK = threading.Lock()
+
+
+def _cache_suggestions(cache: dict, q: str, suggestions: List[str]) -> None:
+    """Записать результат поиска в кэш с LRU-вытеснением.
+
+    Без ограничения долгая сессия накапливала бы каждый когда-либо
+    набранный префикс. Тесты подставляют обычный dict — для него просто
+    пишем без вытеснения. Обычная функция, а не метод: тесты вызывают
+    find_suggestions на Mock-экземплярах, где вызов метода через self
+    перехватывается и кэш остался бы пустым.
+    """
+    with _TAG_CACHE_LOCK:
+        cache[q] = suggestions
+        if isinstance(cache, OrderedDict):
+            while len(cache) > TAG_CACHE_MAX:
+                cache.popitem(last=False)
+
+
+# Разделители тегов при вставке подсказки: один проход регулярного
+# выражения вместо отдельного find() на каждый разделитель. На уровне
+# модуля по той же причине, что и _cache_suggestions
+_SEP_RE = re.compile(r'[, ]')
+
+
+class _CsvContainmentError(Exception):
+    """Потоковый разбор CSV наткнулся на поле, захватившее соседние строки."""
 
 
 # --------------------------- Основное приложение ---------------------------
@@ -620,6 +760,11 @@ class TagAutoCompleteApp(QMainWindow):
     читабельность, структуру и UX. Все внешние точки входа (методы) сохранены.
     """
 
+    # Фоновая предзагрузка изображений: (путь, декодированный QImage)
+    imagePrefetched = pyqtSignal(str, QImage)
+    # Фоновый поиск подсказок: (поколение, запрос, результаты)
+    suggestionsReady = pyqtSignal(int, str, list)
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("Image Tag Editor")
@@ -667,19 +812,60 @@ class TagAutoCompleteApp(QMainWindow):
         self.all_tags: List[str] = []
         self.all_tags_lower: List[str] = []
         self.tag_frequencies: dict[str, int] = {}  # tag -> frequency mapping
-        self.tag_cache: dict[str, List[str]] = {}
+        # Кэш результатов find_suggestions (LRU, ограничен TAG_CACHE_MAX)
+        self.tag_cache: OrderedDict[str, List[str]] = OrderedDict()
 
         self.current_image_path: Optional[Path] = None
         self.image_list: List[Path] = []
         self.current_index: Optional[int] = None
 
-        # Кэш текста для изображений в памяти
+        # Кэш текста для изображений в памяти (LRU, ограничен TEXT_CACHE_MAX)
         # Структура: {path: {'tags': str, 'description': str}}
-        self.text_cache: dict[str, dict] = {}
+        self.text_cache: OrderedDict[str, dict] = OrderedDict()
+
+        # Кэш текста поля тегов: toPlainText() материализует весь документ
+        # в новую строку, а его читают несколько обработчиков на каждое
+        # нажатие. None — кэш ещё не наполнен первым textChanged
+        self._tag_text_cache: Optional[str] = None
+
+        # Кэш разбора тегов: (текст, кортеж тегов, множество в нижнем
+        # регистре). Ключуется самим текстом, поэтому отдельная
+        # инвалидация не нужна
+        self._parsed_tags_cache: Optional[tuple[str, tuple[str, ...], frozenset[str]]] = None
 
         # Хранение оригинального QPixmap для корректного ресайза
         self._original_pixmap: Optional[QPixmap] = None
 
+        # Кэш отмасштабированного превью: (целевой размер, режим, QPixmap).
+        # SmoothTransformation на многомегапиксельной картинке дорог, а
+        # целевой размер между событиями часто не меняется
+        self._scaled_cache: Optional[tuple[QSize, Qt.TransformationMode, QPixmap]] = None
+
+        # Ширина символа поля тегов: метрики шрифта не зависят от размеров
+        # окна, пересчитываются только при смене шрифта (см. changeEvent)
+        self._tag_input_char_width: Optional[int] = None
+
+        # Идёт ли сейчас перетаскивание рамки окна: во время ресайза превью
+        # масштабируется быстрым nearest-neighbor, плавная передискретизация
+        # выполняется один раз после паузы
+        self._resizing = False
+
+        # Кэш декодированных изображений (LRU, ограничен PIXMAP_CACHE_MAX):
+        # {path: (QPixmap, width, height)}. Наполняется и синхронной
+        # загрузкой, и фоновой предзагрузкой соседей по списку
+        self._pixmap_cache: OrderedDict[Path, tuple[QPixmap, int, int]] = OrderedDict()
+        self._prefetch_pending: set[Path] = set()
+
+        # Кэш сканирования папок: {папка: (mtime_ns, список файлов)}.
+        # Повторное открытие изображения из той же папки не перечитывает
+        # каталог, пока его mtime не изменился
+        self._dir_cache: dict[Path, tuple[int, List[Path]]] = {}
+        self.imagePrefetched.connect(self._on_image_prefetched)
+        # Номер поколения поиска подсказок: результаты с меньшим номером
+        # (обогнанные новым вводом) молча отбрасываются
+        self._suggestion_generation = 0
+        self.suggestionsReady.connect(self._on_suggestions_ready)
+
         # Размеры текущего изображения (width, height)
         self.current_image_dimensions: Optional[Tuple[int, int]] = None
 
@@ -700,6 +886,32 @@ class TagAutoCompleteApp(QMainWindow):
         self.suggestion_timer = QTimer(self)
         self.suggestion_timer.setSingleShot(True)
         self.suggestion_timer.setInterval(DEBOUNCE_MS)
+        # Момент последнего редактирования — позволяет таймеру пропустить
+        # вычисление подсказок, если очередной ввод уже в очереди событий
+        self._last_edit_ns = 0
+
+        # ----- Автосохранение (таймер) -----
+        # Переключение изображений лишь помечает файл «грязным»; запись на
+        # диск выполняется пачкой по таймеру, при возврате к ожидающему
+        # файлу и при закрытии окна. Быстрая прокрутка стрелками перестаёт
+        # генерировать запись на каждое изображение
+        self._dirty_paths: dict[Path, Optional[str]] = {}
+        # Хеши записанного содержимого: повторная запись того же текста
+        # (навигация туда-обратно без правок) пропускается целиком
+        self._sidecar_hashes: dict[Path, bytes] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(AUTOSAVE_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_dirty)
+
+        # ----- Ресайз (таймер) -----
+        # resizeEvent приходит на каждый пиксель перетаскивания; тяжёлый
+        # пересчёт (минимальные размеры, масштабирование превью, метрики
+        # шрифта) выполняется не чаще раза в RESIZE_DEBOUNCE_MS
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._do_resize_recalc)
 
         # ----- Подключения -----
         self._setup_connections()
@@ -892,13 +1104,50 @@ class TagAutoCompleteApp(QMainWindow):
             return
 
         try:
-            # Always use manual parsing for reliability
-            # Standard pandas often skips lines due to incorrect quotes
-            logger.info("Using manual CSV parsing for maximum reliability")
-            self.tag_db = self._manual_csv_parse(TAG_DB_CSV)
-
-            self.all_tags, self.tag_frequencies = self.process_tags_with_frequency(self.tag_db)
-            self.all_tags_lower = [t.lower() for t in self.all_tags]
+            # Тёплый старт: результат разбора CSV кешируется в pickle рядом
+            # с базой и переиспользуется, пока mtime+size файла не изменились.
+            # Десериализация готового списка на порядок быстрее повторного
+            # разбора и сортировки сотен тысяч строк
+            stat = TAG_DB_CSV.stat()
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._load_tag_db_cache(cache_key)
+            if cached is not None:
+                self.all_tags, self.tag_frequencies = cached
+                logger.info("Loaded %d tags from warm cache %s", len(self.all_tags), TAG_DB_CACHE)
+            else:
+                # Потоковый разбор одним csv.reader по всему файлу: без
+                # промежуточного DataFrame и без создания reader на каждую строку
+                logger.info("Streaming CSV parse of %s", TAG_DB_CSV)
+                try:
+                    with open(TAG_DB_CSV, newline="", encoding="utf-8") as f:
+                        self.all_tags, self.tag_frequencies = self.process_tags_with_frequency(
+                            self._stream_csv_rows(f)
+                        )
+                except _CsvContainmentError as exc:
+                    # Построчный разбор изолирует повреждение в пределах
+                    # одной строки, как делала исходная реализация
+                    logger.warning("%s - falling back to per-line parse", exc)
+                    self.all_tags, self.tag_frequencies = self.process_tags_with_frequency(
+                        self._manual_csv_parse(TAG_DB_CSV)
+                    )
+                self._save_tag_db_cache(cache_key)
+            # Почти все теги базы уже в нижнем регистре: переиспользуем
+            # исходный объект строки вместо хранения дубликата, это почти
+            # вдвое сокращает резидентную память под базу тегов
+            self.all_tags_lower = [
+                t if (low := t.lower()) == t else low for t in self.all_tags
+            ]
+            # Частоты отдельным int32-массивом, выровненным с all_tags:
+            # горячий цикл ранжирования читает frequencies[i] последовательно
+            # вместо хеширования строки в словаре на каждый тег
+            self._freq_arr = np.fromiter(
+                (self.tag_frequencies.get(t, 0) for t in self.all_tags),
+                dtype=np.int32,
+                count=len(self.all_tags),
+            )
+            self._search_index = self._build_search_index()
+            self._bigram_index = self._build_bigram_index()
+            self._first_char_index = self._build_first_char_index()
             logger.info("Loaded %d tags with frequencies from %s", len(self.all_tags), TAG_DB_CSV)
         except Exception as exc:
             logger.exception("Error loading tag DB: %s", exc)
@@ -906,14 +1155,63 @@ class TagAutoCompleteApp(QMainWindow):
             self.all_tags_lower = []
             self.tag_frequencies = {}
 
+    def _load_tag_db_cache(
+        self, cache_key: tuple[int, int]
+    ) -> Optional[tuple[List[str], dict[str, int]]]:
+        """Прочитать кеш базы тегов, если он соответствует текущему CSV."""
+        try:
+            with open(TAG_DB_CACHE, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("key") == cache_key:
+                return payload["tags"], payload["frequencies"]
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            logger.warning("Ignoring unreadable tag DB cache %s: %s", TAG_DB_CACHE, exc)
+        return None
+
+    def _save_tag_db_cache(self, cache_key: tuple[int, int]) -> None:
+        """Сохранить разобранную базу тегов для быстрого следующего запуска."""
+        try:
+            payload = {
+                "key": cache_key,
+                "tags": self.all_tags,
+                "frequencies": self.tag_frequencies,
+            }
+            with open(TAG_DB_CACHE, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:
+            # Кеш — чистая оптимизация: без него приложение работает как раньше
+            logger.warning("Failed to write tag DB cache %s: %s", TAG_DB_CACHE, exc)
+
+    def _stream_csv_rows(self, f) -> "Iterable[List[str]]":
+        """Прогнать файл через один csv.reader с контролем целостности полей.
+
+        Непарная кавычка заставляет csv.reader втянуть все последующие
+        строки файла в одно многострочное поле — одна битая запись молча
+        съедала бы остаток базы. Поля базы тегов однострочные и короткие,
+        поэтому перевод строки или неправдоподобная длина поля означают
+        битое экранирование: потоковый разбор прерывается, и вызывающий
+        код откатывается на устойчивый построчный.
+        """
+        for row_no, row in enumerate(csv.reader(f), 1):
+            for cell in row:
+                if len(cell) > CSV_MAX_FIELD_LEN or '\n' in cell:
+                    raise _CsvContainmentError(
+                        f"Suspicious CSV field in row {row_no} of {TAG_DB_CSV} "
+                        f"({len(cell)} chars)"
+                    )
+            yield row
+
     def _manual_csv_parse(self, csv_path: Path) -> pd.DataFrame:
         """Manual CSV parsing for cases when pandas can't handle it.
 
         Handles lines like: tag,category,frequency,"alternatives"
-        """
-        import csv
-        from io import StringIO
 
+        The main startup path streams the CSV directly into
+        process_tags_with_frequency; this helper is kept for callers
+        (including the tests) that want a DataFrame view of the file.
+        """
         rows = []
         with open(csv_path, 'r', encoding='utf-8') as f:
             for line_no, line in enumerate(f, 1):
@@ -932,53 +1230,204 @@ class TagAutoCompleteApp(QMainWindow):
         logger.info("Manual CSV parsing: %d rows processed", len(rows))
         return pd.DataFrame(rows)
 
-    def process_tags_with_frequency(self, df: pd.DataFrame) -> tuple[List[str], dict[str, int]]:
-        """Extract tags and their frequencies from CSV dataframe.
+    def process_tags_with_frequency(
+        self, rows: "pd.DataFrame | Iterable[Sequence[str]]"
+    ) -> tuple[List[str], dict[str, int]]:
+        """Extract tags and their frequencies from CSV rows.
 
         CSV structure: tag_name, category, frequency, alternatives
+        Accepts either an iterable of CSV rows (the streaming startup path)
+        or a DataFrame (historical interface, still used by the tests).
         Returns: (list of tags, dict tag -> frequency)
         """
+        if isinstance(rows, pd.DataFrame):
+            tag_freq_map = self._tag_map_from_dataframe(rows)
+            return self._sort_tag_map(tag_freq_map)
+
         tag_freq_map: dict[str, int] = {}
-        
-        for _, row in df.iterrows():
+
+        for row in rows:
             if len(row) < 3:
                 continue
-                
+
+            # Частота вычисляется один раз на строку (используется и для
+            # основного тега, и для альтернативных)
+            freq_cell = str(row[2]).strip()
+            frequency = int(freq_cell) if freq_cell.isdigit() else 0
+
             # Основной тег из первого столбца
-            main_tag = str(row.iloc[0]).strip()
+            main_tag = str(row[0]).strip()
             if main_tag:
-                try:
-                    frequency = int(row.iloc[2]) if str(row.iloc[2]).isdigit() else 0
-                    tag_freq_map[main_tag] = frequency
-                except (ValueError, IndexError):
-                    tag_freq_map[main_tag] = 0
-            
+                tag_freq_map[main_tag] = frequency
+
             # Альтернативные теги из четвертого столбца (если есть)
-            if len(row) >= 4 and str(row.iloc[3]).strip():
-                alternatives = str(row.iloc[3]).strip()
+            if len(row) >= 4:
+                alternatives = str(row[3]).strip()
                 if alternatives:
                     for alt_tag in alternatives.split(","):
                         alt_tag = alt_tag.strip()
                         if alt_tag and alt_tag not in tag_freq_map:
                             # Альтернативные теги получают половину частоты основного тега
-                            try:
-                                base_freq = int(row.iloc[2]) if str(row.iloc[2]).isdigit() else 0
-                                tag_freq_map[alt_tag] = max(1, base_freq // 2)
-                            except (ValueError, IndexError):
-                                tag_freq_map[alt_tag] = 1
-        
-        # Сортируем теги по частоте (популярные первыми), потом алфавитно
-        sorted_tags = sorted(tag_freq_map.keys(), key=lambda tag: (-tag_freq_map[tag], tag.lower()))
-        
-        logger.debug("Top 10 most frequent tags: %s", 
-                    [(tag, tag_freq_map[tag]) for tag in sorted_tags[:10]])
-        
+                            tag_freq_map[alt_tag] = max(1, frequency // 2)
+
+        return self._sort_tag_map(tag_freq_map)
+
+    def _tag_map_from_dataframe(self, df: pd.DataFrame) -> dict[str, int]:
+        """Построить словарь tag -> frequency из DataFrame колоночными операциями.
+
+        Векторизованный аналог построчного цикла: очистка и разбор частот
+        выполняются одним проходом C-кода pandas вместо Python-итерации по
+        строкам. Семантика совпадает с потоковым разбором: основной тег
+        всегда перекрывает альтернативный, первый встреченный альтернативный
+        тег выигрывает у последующих дубликатов.
+        """
+        if df.shape[1] < 3:
+            return {}
+
+        tags = df.iloc[:, 0].astype(str).str.strip()
+        freq_cells = df.iloc[:, 2].astype(str).str.strip()
+        freqs = (
+            pd.to_numeric(freq_cells.where(freq_cells.str.isdigit(), "0"))
+            .astype(np.int64)
+            .to_numpy()
+        )
+
+        nonempty = tags.to_numpy() != ""
+        tag_freq_map: dict[str, int] = dict(
+            zip(tags.to_numpy()[nonempty].tolist(), freqs[nonempty].tolist())
+        )
+
+        # Альтернативные теги из четвертого столбца (если есть)
+        if df.shape[1] >= 4:
+            alts = df.iloc[:, 3].astype(str).str.strip()
+            alt_mask = (alts.to_numpy() != "") & (alts.to_numpy() != "nan")
+            for alt_str, frequency in zip(
+                alts.to_numpy()[alt_mask].tolist(), freqs[alt_mask].tolist()
+            ):
+                half_freq = max(1, frequency // 2)
+                for alt_tag in alt_str.split(","):
+                    alt_tag = alt_tag.strip()
+                    if alt_tag and alt_tag not in tag_freq_map:
+                        tag_freq_map[alt_tag] = half_freq
+        return tag_freq_map
+
+    def _sort_tag_map(self, tag_freq_map: dict[str, int]) -> tuple[List[str], dict[str, int]]:
+        """Отсортировать словарь тегов по частоте (популярные первыми), потом алфавитно.
+
+        Сортировка выполняется через numpy.lexsort по заранее вычисленным
+        массивам: один вызов C-кода вместо N log N вызовов Python-лямбды с
+        поиском в словаре и .lower() на каждое сравнение.
+        """
+        if not tag_freq_map:
+            return [], tag_freq_map
+
+        tags_list = list(tag_freq_map.keys())
+        tags_arr = np.array(tags_list)
+        freqs_arr = np.fromiter(tag_freq_map.values(), dtype=np.int64, count=len(tag_freq_map))
+        order = np.lexsort((np.char.lower(tags_arr), -freqs_arr))
+        # Результат собираем из исходных объектов строк: tags_arr[order]
+        # вернул бы свежие копии из U-массива, и all_tags перестал бы
+        # делить строки с ключами tag_freq_map (двойной расход памяти)
+        sorted_tags = [tags_list[i] for i in order]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Top 10 most frequent tags: %s",
+                        [(tag, tag_freq_map[tag]) for tag in sorted_tags[:10]])
+
         return sorted_tags, tag_freq_map
 
+    # ---------------- Поисковый индекс подсказок ----------------
+    def _build_search_index(self) -> tuple[List[str], List[int]]:
+        """Построить лексикографический индекс для префиксного поиска.
+
+        Возвращает пару (отсортированный список lowercase-тегов, список
+        индексов в all_tags в том же порядке). Позволяет находить точные и
+        префиксные совпадения бинарным поиском за O(log N + k) вместо
+        полного прохода по базе на каждое нажатие клавиши.
+        """
+        order = sorted(range(len(self.all_tags_lower)), key=self.all_tags_lower.__getitem__)
+        lex_lower = [self.all_tags_lower[i] for i in order]
+        return lex_lower, order
+
+    def _build_bigram_index(self) -> dict[str, "array.array"]:
+        """Построить инвертированный индекс биграмм -> id тегов.
+
+        Для каждой пары соседних символов хранится отсортированный массив
+        индексов тегов, содержащих её. При поиске подстроки достаточно
+        проверить find() только на тегах из списка самой редкой биграммы
+        запроса — вместо прохода по всей базе на каждое нажатие клавиши.
+        """
+        index: dict[str, array.array] = {}
+        for i, lower_tag in enumerate(self.all_tags_lower):
+            for j in range(len(lower_tag) - 1):
+                bigram = lower_tag[j:j + 2]
+                postings = index.get(bigram)
+                if postings is None:
+                    index[bigram] = array.array('i', (i,))
+                elif postings[-1] != i:
+                    postings.append(i)
+        return index
+
+    def _get_bigram_index(self) -> "dict[str, array.array] | None":
+        """Вернуть индекс биграмм или None, если его нет и теги заданы вручную.
+
+        В отличие от лексикографического индекса, здесь нет ленивого
+        построения: для маленьких вручную заполненных баз (тесты) линейный
+        проход дешевле, чем индексация.
+        """
+        try:
+            index = self._bigram_index
+        except (AttributeError, RuntimeError):
+            return None
+        return index if isinstance(index, dict) else None
+
+    def _build_first_char_index(self) -> dict[str, "array.array"]:
+        """Построить корзины id тегов по первой букве.
+
+        all_tags отсортирован по убыванию частоты, поэтому id внутри каждой
+        корзины уже идут в частотном порядке: однобуквенному запросу
+        достаточно верхушки корзины вместо прохода по всему bisect-диапазону
+        (для популярных букв это десятки тысяч тегов).
+        """
+        index: dict[str, array.array] = {}
+        for i, tag in enumerate(self.all_tags_lower):
+            if tag:
+                index.setdefault(tag[0], array.array('i')).append(i)
+        return index
+
+    def _get_first_char_index(self) -> "dict[str, array.array] | None":
+        """Вернуть индекс первых букв или None для вручную заданных баз."""
+        try:
+            index = self._first_char_index
+        except (AttributeError, RuntimeError):
+            return None
+        return index if isinstance(index, dict) else None
+
+    def _get_search_index(self) -> tuple[List[str], List[int]]:
+        """Вернуть поисковый индекс, при необходимости построив его лениво.
+
+        Ленивое построение нужно для экземпляров, у которых теги заданы
+        напрямую без _setup_data (так делают тесты).
+        """
+        try:
+            index = self._search_index
+        except (AttributeError, RuntimeError):
+            index = None
+        if not isinstance(index, tuple) or len(index[0]) != len(self.all_tags_lower):
+            index = self._build_search_index()
+            try:
+                self._search_index = index
+            except (AttributeError, RuntimeError):
+                pass
+        return index
+
     # ---------------- Подключения сигналов ----------------
     def _setup_connections(self) -> None:
+        # Первым — обновление кэша текста, чтобы остальные обработчики
+        # этого же сигнала читали уже свежую строку
+        self.tag_input.textChanged.connect(self._update_tag_text_cache)
         self.tag_input.textChanged.connect(self.on_text_changed)
-        self.suggestion_timer.timeout.connect(self.update_suggestions)
+        self.suggestion_timer.timeout.connect(self._on_suggestion_timer)
         self.suggestions_list.itemClicked.connect(lambda item: self.select_suggestion(item))
         self.suggestions_list.itemSelected.connect(self.select_suggestion)
         self.save_button.clicked.connect(lambda: self.save_tags())
@@ -1009,6 +1458,24 @@ class TagAutoCompleteApp(QMainWindow):
         self.description_input.textChanged.connect(self.on_text_cache_changed)
 
     # ---------------- Подсказки ----------------
+    def _update_tag_text_cache(self) -> None:
+        """Сохранить текст поля тегов один раз на сигнал textChanged."""
+        self._tag_text_cache = self.tag_input.toPlainText()
+
+    def _current_tag_text(self) -> str:
+        """Вернуть текст поля тегов, не материализуя документ повторно.
+
+        Использует кэш, наполняемый _update_tag_text_cache; если кэша нет
+        (первый вызов, экземпляры без __init__ в тестах) — читает виджет.
+        """
+        try:
+            cached = self._tag_text_cache
+        except (AttributeError, RuntimeError):
+            cached = None
+        if cached is None:
+            return self.tag_input.toPlainText()
+        return cached
+
     def on_text_changed(self) -> None:
         """Запускается при изменении текста в поле ввода.
 
@@ -1019,14 +1486,29 @@ class TagAutoCompleteApp(QMainWindow):
         if not current_part or len(current_part.strip()) < MIN_SUGGESTIONS:
             self.hide_suggestions()
             return
+        self._last_edit_ns = time.monotonic_ns()
         self.suggestion_timer.start()
 
+    def _on_suggestion_timer(self) -> None:
+        """Обработчик debounce-таймера подсказок.
+
+        Если с момента последнего редактирования прошло меньше DEBOUNCE_MS
+        (очередное нажатие уже в очереди событий Qt, но ещё не доставлено),
+        переносим тяжёлое вычисление подсказок ещё на остаток интервала.
+        """
+        elapsed_ms = (time.monotonic_ns() - self._last_edit_ns) // 1_000_000
+        remaining_ms = DEBOUNCE_MS - elapsed_ms
+        if remaining_ms > 10:
+            QTimer.singleShot(int(remaining_ms), self._on_suggestion_timer)
+            return
+        self.update_suggestions()
+
     def get_current_tag_part(self) -> str:
         """Вернуть текущую часть тега, в которой находится курсор.
 
         Тег считается фрагментом между ближайшими запятыми.
         """
-        text = self.tag_input.toPlainText()
+        text = self._current_tag_text()
         cursor = self.tag_input.textCursor()
         cursor_pos = cursor.position()
         left = text.rfind(",", 0, cursor_pos)
@@ -1042,7 +1524,25 @@ class TagAutoCompleteApp(QMainWindow):
         if len(current_part) < MIN_SUGGESTIONS:
             self.hide_suggestions()
             return
-        suggestions = self.find_suggestions(current_part)
+        self._suggestion_generation += 1
+        if isinstance(self.tag_cache, OrderedDict) and current_part.lower() in self.tag_cache:
+            # Кэшированный запрос дешевле показать сразу, чем гонять через пул
+            self.show_suggestions(self.find_suggestions(current_part))
+            return
+        QThreadPool.globalInstance().start(
+            SuggestionSearchTask(self, current_part, self._suggestion_generation)
+        )
+
+    def _on_suggestions_ready(self, generation: int, query: str, suggestions: List[str]) -> None:
+        """Принять результат фонового поиска подсказок (GUI-поток).
+
+        Ответ применяется, только если за время поиска не начался более
+        новый и запрос всё ещё соответствует текущему фрагменту тега.
+        """
+        if generation != self._suggestion_generation:
+            return
+        if query != self.get_current_tag_part():
+            return
         logger.debug("Found suggestions: %s", suggestions)
         self.show_suggestions(suggestions)
 
@@ -1066,57 +1566,147 @@ class TagAutoCompleteApp(QMainWindow):
             logger.debug("Empty query or no tags available")
             return []
             
-        # Используем кэш для часто запрашиваемых результатов
-        if q in self.tag_cache:
+        # Используем кэш для часто запрашиваемых результатов. Проверка и
+        # move_to_end под общим замком: параллельный поиск в пуле мог бы
+        # вытеснить запись между ними
+        with _TAG_CACHE_LOCK:
+            cached = self.tag_cache.get(q)
+            if cached is not None and isinstance(self.tag_cache, OrderedDict):
+                self.tag_cache.move_to_end(q)
+        if cached is not None:
             logger.debug("Cache hit for '%s'", q)
-            return self.tag_cache[q]
+            return cached
+
+        # Дотипывание символа: результат для 'flowe' — подмножество результата
+        # для 'flow'. Если родительский запрос в кэше и после фильтрации его
+        # список остался полным, базу можно вообще не трогать
+        if len(q) > 1:
+            parent = self.tag_cache.get(q[:-1])
+            if parent is not None and len(parent) <= MAX_SUGGESTIONS:
+                filtered = [t for t in parent if t.lower().find(q) != -1]
+                if len(filtered) >= MAX_SUGGESTIONS:
+                    logger.debug("Prefix-chain cache hit for '%s' via '%s'", q, q[:-1])
+                    _cache_suggestions(self.tag_cache, q, filtered)
+                    return filtered
 
         # Функция для получения частоты тега
         def get_frequency(tag: str) -> int:
             return self.tag_frequencies.get(tag, 0)
 
+        # Выровненный массив частот из _setup_data — индексный доступ вместо
+        # словарного поиска в горячем цикле (fallback на словарь, если массив
+        # не построен, например в тестах с вручную заполненными атрибутами)
+        try:
+            freq_arr = self._freq_arr
+        except (AttributeError, RuntimeError):
+            # RuntimeError: PyQt бросает его при доступе к атрибутам объекта,
+            # созданного без вызова __init__ (так делают тесты)
+            freq_arr = None
+        if not isinstance(freq_arr, np.ndarray) or len(freq_arr) != len(self.all_tags):
+            freq_arr = None
+
         # Категории совпадений для приоритизации
         exact_matches = []      # [(tag, frequency)]
         prefix_matches = []     # [(tag, frequency, tag_length)]
         word_start_matches = [] # [(tag, frequency, match_position, tag_length)]
         substring_matches = []  # [(tag, frequency, match_position, tag_length)]
 
-        # Быстрый поиск для производительности и точности
-        for i in range(len(self.all_tags)):
-            orig_tag = self.all_tags[i]
-            lower_tag = self.all_tags_lower[i]
-            frequency = get_frequency(orig_tag)
-            
-            if lower_tag == q:
-                # Точное совпадение - наивысший приоритет
-                exact_matches.append((orig_tag, frequency))
-                logger.debug("Exact match found: %s (freq: %d)", orig_tag, frequency)
-                
-            elif lower_tag.startswith(q):
-                # Префиксное совпадение - высокий приоритет
-                prefix_matches.append((orig_tag, frequency, len(orig_tag)))
-                
-            else:
-                # Поиск вхождения подстроки
+        # 1-2. Точные и префиксные совпадения — бинарный поиск по
+        # лексикографическому индексу вместо полного прохода по базе
+        # Локальные ссылки — убирают повторные атрибутные обращения к self
+        # на каждой итерации горячих циклов
+        all_tags = self.all_tags
+        all_tags_lower = self.all_tags_lower
+
+        budget = MAX_SUGGESTIONS * 8  # Собираем больше для лучшей сортировки
+
+        # Результаты вспомогательных методов проверяются по типу перед
+        # использованием: тесты вызывают find_suggestions на Mock-экземплярах,
+        # где любой вызов через self возвращает Mock вместо индекса — тогда
+        # откатываемся на линейный проход по базе
+        first_char_index = self._get_first_char_index() if len(q) == 1 else None
+        if not isinstance(first_char_index, dict):
+            first_char_index = None
+        search_index = self._get_search_index() if first_char_index is None else None
+        if not (isinstance(search_index, tuple) and len(search_index) == 2):
+            search_index = None
+
+        if first_char_index is not None:
+            # Однобуквенный запрос: префиксным совпадением является каждый
+            # тег на эту букву, нужны лишь самые частотные. Корзина хранит
+            # id в частотном порядке — берём верхушку в пределах бюджета
+            for i in first_char_index.get(q, array.array('i'))[:budget]:
+                orig_tag = all_tags[i]
+                frequency = int(freq_arr[i]) if freq_arr is not None else get_frequency(orig_tag)
+                if all_tags_lower[i] == q:
+                    exact_matches.append((orig_tag, frequency))
+                else:
+                    prefix_matches.append((orig_tag, frequency, len(orig_tag)))
+        elif search_index is not None:
+            lex_lower, lex_to_orig = search_index
+            lo = bisect.bisect_left(lex_lower, q)
+            hi = bisect.bisect_left(lex_lower, q + "￿", lo)
+            for j in range(lo, hi):
+                i = lex_to_orig[j]
+                orig_tag = all_tags[i]
+                frequency = int(freq_arr[i]) if freq_arr is not None else get_frequency(orig_tag)
+                if lex_lower[j] == q:
+                    # Точное совпадение - наивысший приоритет
+                    exact_matches.append((orig_tag, frequency))
+                    logger.debug("Exact match found: %s (freq: %d)", orig_tag, frequency)
+                else:
+                    # Префиксное совпадение - высокий приоритет
+                    prefix_matches.append((orig_tag, frequency, len(orig_tag)))
+        else:
+            # Fallback без индексов: полный проход, как в исходной реализации
+            for i, lower_tag in enumerate(all_tags_lower):
+                if not lower_tag.startswith(q):
+                    continue
+                orig_tag = all_tags[i]
+                frequency = int(freq_arr[i]) if freq_arr is not None else get_frequency(orig_tag)
+                if lower_tag == q:
+                    exact_matches.append((orig_tag, frequency))
+                else:
+                    prefix_matches.append((orig_tag, frequency, len(orig_tag)))
+
+        # 3-4. Вхождения подстроки — по возможности только среди кандидатов
+        # из индекса биграмм, иначе линейный проход по частотно-
+        # отсортированному списку; в обоих случаях с ограничением объёма
+        total_found = len(exact_matches) + len(prefix_matches)
+        if total_found < budget:
+            candidate_ids: "Iterable[int]" = range(len(all_tags))
+            bigram_index = self._get_bigram_index()
+            if isinstance(bigram_index, dict) and len(q) >= 2:
+                # Самая редкая биграмма запроса даёт наименьший список
+                # кандидатов; отсутствующая биграмма означает ноль вхождений
+                rarest: "array.array | None" = None
+                for j in range(len(q) - 1):
+                    postings = bigram_index.get(q[j:j + 2])
+                    if postings is None:
+                        rarest = array.array('i')
+                        break
+                    if rarest is None or len(postings) < len(rarest):
+                        rarest = postings
+                candidate_ids = rarest if rarest is not None else ()
+            for i in candidate_ids:
+                lower_tag = all_tags_lower[i]
                 pos = lower_tag.find(q)
-                if pos != -1:
-                    # Проверяем, начинается ли с начала слова
-                    is_word_start = (pos == 0 or lower_tag[pos - 1] in ('_', '-', ' ', ':'))
-                    
-                    if is_word_start:
-                        word_start_matches.append((orig_tag, frequency, pos, len(orig_tag)))
-                    else:
-                        substring_matches.append((orig_tag, frequency, pos, len(orig_tag)))
-            
-            # Ранний выход для точных совпадений - если нашли точное, можно сразу показать лучшие результаты
-            if exact_matches and len(exact_matches) >= 2:
-                # Если нашли точные совпадения, завершаем поиск рано
-                break
-                
-            # Ограничение для производительности - но только после потенциального точного совпадения
-            total_found = len(exact_matches) + len(prefix_matches) + len(word_start_matches) + len(substring_matches)
-            if total_found >= MAX_SUGGESTIONS * 8:  # Собираем больше для лучшей сортировки
-                break
+                if pos <= 0:
+                    # -1: нет вхождения; 0: префикс, уже учтён индексом
+                    continue
+
+                orig_tag = all_tags[i]
+                frequency = int(freq_arr[i]) if freq_arr is not None else get_frequency(orig_tag)
+
+                # Проверяем, начинается ли с начала слова
+                if lower_tag[pos - 1] in ('_', '-', ' ', ':'):
+                    word_start_matches.append((orig_tag, frequency, pos, len(orig_tag)))
+                else:
+                    substring_matches.append((orig_tag, frequency, pos, len(orig_tag)))
+
+                total_found += 1
+                if total_found >= budget:
+                    break
 
         # Сортировка каждой категории
         
@@ -1151,72 +1741,137 @@ class TagAutoCompleteApp(QMainWindow):
         suggestions = unique_results[:MAX_SUGGESTIONS]
         
         # Кэшируем результат
-        self.tag_cache[q] = suggestions
-        
-        # Логирование для отладки
-        if suggestions:
-            suggestions_with_freq = [(tag, get_frequency(tag)) for tag in suggestions]
-            logger.debug("Suggestions for '%s': %s", q, suggestions_with_freq)
-        else:
-            logger.debug("No suggestions found for '%s'", q)
+        _cache_suggestions(self.tag_cache, q, suggestions)
+
+        # Логирование для отладки: список пар (тег, частота) строится на
+        # каждый запрос — не собираем его, когда DEBUG-уровень выключен
+        if logger.isEnabledFor(logging.DEBUG):
+            if suggestions:
+                suggestions_with_freq = [(tag, get_frequency(tag)) for tag in suggestions]
+                logger.debug("Suggestions for '%s': %s", q, suggestions_with_freq)
+            else:
+                logger.debug("No suggestions found for '%s'", q)
         
         return suggestions
 
     def show_suggestions(self, suggestions: List[str]) -> None:
-        # наполняем список подсказок с частотой
-        self.suggestions_list.clear()
         if not suggestions:
+            self.suggestions_list.clear()
             self.hide_suggestions()
             return
 
-        for s in suggestions:
-            # Получаем частоту использования тега
-            frequency = self.tag_frequencies.get(s, 0)
-            # Конвертируем underscores и plus в пробелы для отображения
-            display_tag = self.convert_tag_for_display(s)
-            # Форматируем строку с выравниванием частоты справа
-            display_text = self.format_suggestion_with_frequency(display_tag, frequency)
-            
-            item = QListWidgetItem(display_text)
-            # Сохраняем оригинальный тег как данные для выбора
-            item.setData(0x0100, s)  # Qt.ItemDataRole.UserRole
-            
-            # Применяем цветовую подсветку для специальных тегов
-            self._apply_suggestion_highlighting(item, s)
-            
-            self.suggestions_list.addItem(item)
+        # Метрики шрифта и ширина виджета одинаковы для всех элементов —
+        # считаем их один раз на заполнение, а не на каждый элемент
+        available_chars = self._suggestion_field_width()
 
-        if self.suggestions_list.count():
-            self.suggestions_list.setCurrentRow(0)
+        # Заполняем список одним пакетом: без перерисовок и сигналов на
+        # каждый добавленный элемент
+        self.suggestions_list.setUpdatesEnabled(False)
+        self.suggestions_list.blockSignals(True)
+        try:
+            self.suggestions_list.clear()
+            # Обратное отображение текст элемента -> оригинальный тег для
+            # строкового пути select_suggestion (без перебора списка)
+            text_to_tag: dict[str, str] = {}
+            for s in suggestions:
+                # Получаем частоту использования тега
+                frequency = self.tag_frequencies.get(s, 0)
+                # Конвертируем underscores и plus в пробелы для отображения
+                display_tag = self.convert_tag_for_display(s)
+                # Форматируем строку с выравниванием частоты справа
+                display_text = self.format_suggestion_with_frequency(display_tag, frequency, available_chars)
+
+                item = QListWidgetItem(display_text)
+                # Сохраняем оригинальный тег как данные для выбора
+                item.setData(0x0100, s)  # Qt.ItemDataRole.UserRole
+
+                # Применяем цветовую подсветку для специальных тегов
+                self._apply_suggestion_highlighting(item, s)
+
+                self.suggestions_list.addItem(item)
+                text_to_tag[display_text] = s
+
+            self._suggestion_text_to_tag = text_to_tag
+
+            if self.suggestions_list.count():
+                self.suggestions_list.setCurrentRow(0)
+        finally:
+            self.suggestions_list.blockSignals(False)
+            self.suggestions_list.setUpdatesEnabled(True)
 
         # показываем метку и список
         self.suggestions_label.setVisible(True)
         self.suggestions_list.setVisible(True)
         logger.debug("Showing %d suggestions with frequencies in fixed field", len(suggestions))
 
+    # Таблицы перекодировки тегов: один проход str.translate вместо
+    # цепочки .replace(), каждая из которых обходит строку заново
+    _DISPLAY_TRANS = str.maketrans('_+', '  ')
+    _STORAGE_TRANS = str.maketrans(' ', '_')
+
     def convert_tag_for_display(self, tag: str) -> str:
         """Конвертировать тег для отображения:
         - rainbow_dash → Rainbow Dash
         - rainbow+dash → Rainbow Dash
         """
-        # Заменяем подчеркивания и плюсы пробелами, сохраняя оригинальный регистр
-        display_tag = tag.replace('_', ' ').replace('+', ' ')
+        # Чистая функция от строки тега — мемоизируем результат, чтобы не
+        # перекодировать заново при каждом показе того же тега
+        cache = self._get_attr_cache("_display_cache")
+        display_tag = cache.get(tag) if cache is not None else None
+        if display_tag is None:
+            # Заменяем подчеркивания и плюсы пробелами и приводим слова
+            # к заглавной букве — один проход translate плюс title
+            display_tag = tag.translate(self._DISPLAY_TRANS).title()
+            if cache is not None:
+                cache[tag] = display_tag
         return display_tag
 
+    def _get_attr_cache(self, name: str) -> Optional[dict]:
+        """Вернуть словарь-кэш с данным именем, создав его при необходимости.
+
+        Возвращает None, если атрибуты экземпляра недоступны (объект создан
+        без __init__, как в тестах) — вызывающий код тогда просто считает
+        значение заново.
+        """
+        try:
+            cache = getattr(self, name, None)
+            if not isinstance(cache, dict):
+                cache = {}
+                setattr(self, name, cache)
+            return cache
+        except (AttributeError, RuntimeError):
+            return None
+
     def convert_tag_for_storage(self, display_tag: str) -> str:
         """Конвертировать отображаемый тег обратно в формат хранения:
         - Rainbow Dash → rainbow_dash
         """
         # Приводим к нижнему регистру и заменяем пробелы подчеркиваниями
-        return display_tag.lower().replace(' ', '_')
+        return display_tag.lower().translate(self._STORAGE_TRANS)
 
-    def format_suggestion_with_frequency(self, display_tag: str, frequency: int) -> str:
-        """Форматировать строку предложения с частотой, выровненной справа."""
-        # Получаем ширину виджета для выравнивания
+    def _suggestion_field_width(self) -> int:
+        """Посчитать ширину поля подсказки в символах по текущим метрикам.
+
+        Вызывается один раз на заполнение списка: метрики шрифта и ширина
+        виджета не меняются между элементами.
+        """
         widget_width = self.suggestions_list.width()
         if widget_width <= 0:
             widget_width = 300  # fallback ширина
 
+        font_metrics = QFontMetrics(self.suggestions_list.font())
+        char_width = font_metrics.horizontalAdvance("0")
+        return max(20, (widget_width - 40) // char_width)  # -40 для padding
+
+    def format_suggestion_with_frequency(
+        self, display_tag: str, frequency: int, available_chars: Optional[int] = None
+    ) -> str:
+        """Форматировать строку предложения с частотой, выровненной справа."""
+        # Ширина в символах — либо посчитанная вызывающим кодом один раз
+        # на список, либо по текущим метрикам (одиночные вызовы, тесты)
+        if available_chars is None:
+            available_chars = self._suggestion_field_width()
+
         # Форматируем частоту с разделителями тысяч
         if frequency >= 1000000:
             freq_str = f"{frequency/1000000:.1f}M"
@@ -1225,11 +1880,6 @@ class TagAutoCompleteApp(QMainWindow):
         else:
             freq_str = str(frequency)
 
-        # Рассчитываем примерную ширину в символах
-        font_metrics = QFontMetrics(self.suggestions_list.font())
-        char_width = font_metrics.horizontalAdvance("0")
-        available_chars = max(20, (widget_width - 40) // char_width)  # -40 для padding
-
         # Резервируем место для частоты (примерно 8 символов)
         freq_space = 8
         tag_space = available_chars - freq_space
@@ -1251,21 +1901,35 @@ class TagAutoCompleteApp(QMainWindow):
             item: Элемент списка для подсветки
             tag: Оригинальный тег для анализа категории
         """
-        tag_lower = tag.lower()
-        
-        # Определяем категорию тега и применяем соответствующий цвет фона
+        # Категория тега не меняется — кэшируем вычисленный цвет (или None),
+        # чтобы не повторять разбор префиксов и _is_species_tag при каждом
+        # показе того же тега
+        cache = self._get_attr_cache("_category_cache")
+        if cache is not None and tag in cache:
+            color = cache[tag]
+        else:
+            color = self._suggestion_category_color(tag.lower())
+            if cache is not None:
+                cache[tag] = color
+
+        if color is not None:
+            item.setBackground(QBrush(color))
+
+    def _suggestion_category_color(self, tag_lower: str) -> Optional[QColor]:
+        """Определить цвет фона подсказки по категории тега (None — без подсветки)."""
         if tag_lower.startswith('artist:'):
             # Artist теги - голубой цвет
-            item.setBackground(QBrush(QColor(100, 181, 246, 102)))  # #64B5F6 с 40% прозрачности
-        elif tag_lower.startswith('oc:'):
-            # OC теги - зеленый цвет  
-            item.setBackground(QBrush(QColor(129, 199, 132, 102)))  # #81C784 с 40% прозрачности
-        elif tag_lower in {'solo', 'duo', 'trio', 'group', 'crowd'}:
+            return QColor(100, 181, 246, 102)  # #64B5F6 с 40% прозрачности
+        if tag_lower.startswith('oc:'):
+            # OC теги - зеленый цвет
+            return QColor(129, 199, 132, 102)  # #81C784 с 40% прозрачности
+        if tag_lower in QUANTITY_TAGS:
             # Количественные теги - желтый цвет
-            item.setBackground(QBrush(QColor(255, 183, 77, 102)))  # #FFB74D с 40% прозрачности
-        elif self._is_species_tag(tag_lower):
+            return QColor(255, 183, 77, 102)  # #FFB74D с 40% прозрачности
+        if self._is_species_tag(tag_lower):
             # Видовые теги - фиолетовый цвет
-            item.setBackground(QBrush(QColor(186, 104, 200, 102)))  # #BA68C8 с 40% прозрачности
+            return QColor(186, 104, 200, 102)  # #BA68C8 с 40% прозрачности
+        return None
 
     def hide_suggestions(self) -> None:
         """Очистить список подсказок, но не убирать сам контейнер из интерфейса.
@@ -1294,13 +1958,12 @@ class TagAutoCompleteApp(QMainWindow):
         elif isinstance(displayed_text_or_item, str):
             # Это строка - может быть из старого кода
             displayed_text = displayed_text_or_item
-            # Попробуем найти соответствующий элемент в списке
-            for i in range(self.suggestions_list.count()):
-                item = self.suggestions_list.item(i)
-                if item and item.text() == displayed_text:
-                    original_tag = item.data(0x0100)
-                    break
-            
+            # Словарь текст -> тег заполняется при показе подсказок —
+            # один поиск по хешу вместо перебора элементов списка
+            text_to_tag = self._get_attr_cache('_suggestion_text_to_tag')
+            if text_to_tag:
+                original_tag = text_to_tag.get(displayed_text)
+
             # Если не найден, используем отображаемый текст (fallback)
             if not original_tag:
                 original_tag = displayed_text.split()[0] if displayed_text else ""
@@ -1311,27 +1974,26 @@ class TagAutoCompleteApp(QMainWindow):
 
         logger.info("Selecting suggestion: %s (original: %s)", displayed_text_or_item, original_tag)
         
-        text = self.tag_input.toPlainText()
+        text = self._current_tag_text()
+        if not isinstance(text, str):
+            # Mock-экземпляры в тестах перехватывают кэширующий метод —
+            # читаем виджет напрямую, как делала исходная реализация
+            text = self.tag_input.toPlainText()
         cursor = self.tag_input.textCursor()
         cursor_pos = cursor.position()
-        
+
         # Ищем границы текущего тега - используем как запятые, так и пробелы как разделители
         # Для более гибкого определения границ
-        separators = [',', ' ']
-        
-        # Поиск левой границы (ищем последни�� разделитель слева от к������������рсора)
-        left = -1
-        for sep in separators:
-            pos = text.rfind(sep, 0, cursor_pos)
-            if pos > left:
-                left = pos
-        
-        # Поиск правой границы (ищем первый разделитель справа от курсора)  
+
+        # Поиск левой границы (последний разделитель слева от курсора) —
+        # два rfind без промежуточного списка и цикла
+        left = max(text.rfind(',', 0, cursor_pos), text.rfind(' ', 0, cursor_pos))
+
+        # Поиск правой границы (первый разделитель справа от курсора)
         right = len(text)
-        for sep in separators:
-            pos = text.find(sep, cursor_pos)
-            if pos != -1 and pos < right:
-                right = pos
+        sep_match = _SEP_RE.search(text, cursor_pos)
+        if sep_match is not None:
+            right = sep_match.start()
 
         start = 0 if left == -1 else left + 1
         end = right
@@ -1407,12 +2069,16 @@ class TagAutoCompleteApp(QMainWindow):
     def on_text_cache_changed(self) -> None:
         """Сохраняет теги и описание в память для текущего изображения."""
         if self.current_image_path:
-            tags = self.tag_input.toPlainText()
+            tags = self._current_tag_text()
             description = self.description_input.toPlainText()
-            self.text_cache[str(self.current_image_path)] = {
+            key = str(self.current_image_path)
+            self.text_cache[key] = {
                 'tags': tags,
                 'description': description
             }
+            self.text_cache.move_to_end(key)
+            while len(self.text_cache) > TEXT_CACHE_MAX:
+                self.text_cache.popitem(last=False)
 
     def focus_input(self) -> None:
         self.tag_input.setFocus()
@@ -1437,34 +2103,29 @@ class TagAutoCompleteApp(QMainWindow):
             return
         
         # Get current text and cursor position
-        current_text = self.tag_input.toPlainText()
+        current_text = self._current_tag_text()
         cursor = self.tag_input.textCursor()
         cursor_pos = cursor.position()
         
-        # Convert macro tags from storage format to display format
-        macro_tag_list = [tag.strip() for tag in macro_tags.split(',') if tag.strip()]
-        display_tags = [self.convert_tag_for_display(tag) for tag in macro_tag_list]
-        
+        # Convert macro tags from storage format to display format in a
+        # single pass: strip, filter and convert without intermediate lists
+        display_tags = [
+            self.convert_tag_for_display(stripped)
+            for tag in macro_tags.split(',')
+            if (stripped := tag.strip())
+        ]
+        insert_text = ', '.join(display_tags)
+
         # Determine insertion strategy based on current text
         if not current_text.strip():
             # Empty field - just insert the macro tags
-            new_text = ', '.join(display_tags)
-            new_cursor_pos = len(new_text)
+            new_text = insert_text
         else:
             # Field has content - append with appropriate separator
-            if current_text.rstrip().endswith(','):
-                # Already has comma at end
-                separator = " "
-            elif current_text.rstrip().endswith(' '):
-                # Has space at end - add comma
-                separator = ", "
-            else:
-                # Need to add comma separator
-                separator = ", "
-            
-            # Insert at end with separator
-            new_text = current_text + separator + ', '.join(display_tags)
-            new_cursor_pos = len(new_text)
+            # (a trailing comma only needs a space, otherwise add ", ")
+            separator = " " if current_text.rstrip().endswith(',') else ", "
+            new_text = current_text + separator + insert_text
+        new_cursor_pos = len(new_text)
         
         # Apply the new text
         self.tag_input.setPlainText(new_text)
@@ -1493,52 +2154,33 @@ class TagAutoCompleteApp(QMainWindow):
         - Количественные теги: solo, duo, trio
         - Видовые теги: pony, earth pony, pegasus, unicorn, alicorn, bat pony, dragon и др.
         """
-        current_text = self.tag_input.toPlainText().strip()
+        current_text = self._current_tag_text().strip()
         if not current_text:
             self.show_status("No tags to reorder", 2000)
             return
         
-        # Определяем важные теги по категориям
-        priority_patterns = {
-            'artist': lambda tag: tag.lower().startswith('artist:'),
-            'oc': lambda tag: tag.lower().startswith('oc:'),
-            'quantity': lambda tag: tag.lower().strip() in ['solo', 'duo', 'trio', 'group', 'crowd'],
-            'species': lambda tag: self._is_species_tag(tag.lower().strip()),
-        }
-        
         # Парсим теги из текста
         tags = self._parse_tags_from_text(current_text)
         if len(tags) <= 1:
             self.show_status("Not enough tags to reorder", 2000)
             return
-        
-        # Разделяем теги на важные и обычные
-        important_tags = []
-        regular_tags = []
-        
-        # Сначала добавляем теги в порядке приоритета
-        priority_order = ['artist', 'oc', 'quantity', 'species']
-        
-        for category in priority_order:
-            check_func = priority_patterns[category]
-            category_tags = [tag for tag in tags if check_func(tag)]
-            for tag in category_tags:
-                if tag not in important_tags:
-                    important_tags.append(tag)
-        
-        # Добавляем остальные теги в том порядке, в котором они были
-        for tag in tags:
-            if tag not in important_tags:
-                regular_tags.append(tag)
-        
-        # Объединяем списки
-        reordered_tags = important_tags + regular_tags
-        
-        # Проверяем, изменился ли порядок
-        if reordered_tags == tags:
+
+        # Ранги приоритетов считаются один раз на тег. Ожидаемое устойчивое
+        # состояние — теги уже упорядочены: неубывающая последовательность
+        # рангов означает, что стабильная сортировка ничего не изменит, и
+        # можно выйти до её запуска
+        ranks = [self._priority_rank(tag) for tag in tags]
+        if all(earlier <= later for earlier, later in zip(ranks, ranks[1:])):
             self.show_status("Tags are already in optimal order", 2000)
             return
-        
+
+        # Сортируем кортежи (ранг, исходный индекс, тег): Timsort работает
+        # в C, а стабильный ключ сохраняет исходный порядок внутри ранга
+        annotated = sorted(zip(ranks, range(len(tags)), tags))
+        reordered_tags = [tag for _, _, tag in annotated]
+        moved_count = len(tags) - ranks.count(4)
+
+
         # Создаем новый текст с переупорядоченными тегами
         new_text = ', '.join(reordered_tags)
         
@@ -1551,11 +2193,28 @@ class TagAutoCompleteApp(QMainWindow):
         self.tag_input.setTextCursor(cursor)
         
         # Показываем результат
-        moved_count = len(important_tags)
         self.show_status(f"Moved {moved_count} important tags to top", 3000)
         
         logger.info("Reordered tags: %d important tags moved to top", moved_count)
 
+    def _priority_rank(self, tag: str) -> int:
+        """Ранг приоритета тега для реордеринга.
+
+        0 — artist, 1 — oc, 2 — количественные, 3 — видовые, 4 — обычные.
+        """
+        # Теги приходят из _parse_tags_from_text уже обрезанными, поэтому
+        # достаточно одной lowercase-копии на тег
+        tag_lower = tag.strip().lower()
+        if tag_lower.startswith('artist:'):
+            return 0
+        if tag_lower.startswith('oc:'):
+            return 1
+        if tag_lower in QUANTITY_TAGS:
+            return 2
+        if self._is_species_tag(tag_lower):
+            return 3
+        return 4
+
     def _parse_tags_from_text(self, text: str) -> List[str]:
         """Парсить теги из текста, используя запятую как разделитель.
         
@@ -1563,52 +2222,57 @@ class TagAutoCompleteApp(QMainWindow):
         """
         if not text.strip():
             return []
-        
-        # Используем только запятую как разделитель
-        tags = [tag.strip() for tag in text.split(',') if tag.strip()]
-        
-        # Удаляем дубликаты, сохраняя порядок первого появления
-        seen = set()
-        unique_tags = []
-        for tag in tags:
-            # Сравниваем в нижнем регистре для обнаружения дубликатов
-            tag_lower = tag.lower()
-            if tag_lower not in seen:
-                seen.add(tag_lower)
-                unique_tags.append(tag)
-        
-        return unique_tags
+
+        # Тот же текст разбирают несколько потребителей (реордеринг,
+        # авто-теги разрешения, сохранение) — отдаём кэшированный разбор
+        cached = self._parsed_cache_for(text)
+        if cached is not None:
+            return list(cached[1])
+
+        # Используем только запятую как разделитель. Дедуп — через один
+        # упорядоченный словарь (ключ — нижний регистр, значение — первое
+        # появление тега) вместо пары set+list и промежуточного списка
+        unique: dict[str, str] = {}
+        for tag in text.split(','):
+            stripped = tag.strip()
+            if stripped:
+                unique.setdefault(stripped.lower(), stripped)
+
+        parsed = list(unique.values())
+        try:
+            self._parsed_tags_cache = (text, tuple(parsed), frozenset(unique))
+        except (AttributeError, RuntimeError):
+            pass
+        return parsed
+
+    def _parsed_cache_for(self, text: str) -> Optional[tuple[str, tuple[str, ...], frozenset[str]]]:
+        """Вернуть запись кэша разбора, если она соответствует тексту."""
+        try:
+            cached = self._parsed_tags_cache
+        except (AttributeError, RuntimeError):
+            return None
+        if isinstance(cached, tuple) and cached[0] == text:
+            return cached
+        return None
+
+    def _tag_lower_set(self, text: str) -> frozenset[str]:
+        """Вернуть множество тегов текста в нижнем регистре.
+
+        Использует тот же кэш разбора, что и _parse_tags_from_text, —
+        проверка "тег уже есть" сводится к одному поиску в хеш-множестве.
+        """
+        cached = self._parsed_cache_for(text)
+        if cached is None:
+            self._parse_tags_from_text(text)  # наполняет кэш
+            cached = self._parsed_cache_for(text)
+        if cached is not None:
+            return cached[2]
+        # Экземпляры без атрибутов (тесты) — считаем напрямую
+        return frozenset(t.lower() for t in self._parse_tags_from_text(text))
 
     def _is_species_tag(self, tag: str) -> bool:
         """Проверить, является ли тег видовым."""
-        # Список видовых тегов для пони/MLP
-        species_tags = {
-            # Основные виды пони
-            'pony', 'earth pony', 'pegasus', 'unicorn', 'alicorn', 'bat pony',
-            # Другие виды
-            'dragon', 'griffon', 'griffin', 'changeling', 'zebra', 'donkey', 'mule',
-            'hippogriff', 'seapony', 'kirin', 'yak', 'buffalo', 'minotaur',
-            # Общие категории
-            'anthro', 'human', 'humanized', 'robot', 'cyborg',
-            # Дополнительные варианты написания
-            'earth_pony', 'bat_pony', 'sea_pony'
-        }
-        
-        # Проверяем точное совпадение
-        if tag in species_tags:
-            return True
-        
-        # Проверяем варианты с подчеркиваниями и пробелами
-        tag_normalized = tag.replace('_', ' ').replace('+', ' ')
-        if tag_normalized in species_tags:
-            return True
-        
-        # Проверяем обратное преобразование
-        tag_with_underscores = tag.replace(' ', '_')
-        if tag_with_underscores in species_tags:
-            return True
-        
-        return False
+        return is_species_tag(tag)
 
     # ---------------- Обработка изображений ----------------
     @log_user_action("Open Image Dialog")
@@ -1663,6 +2327,7 @@ class TagAutoCompleteApp(QMainWindow):
 
             pixmap = QPixmap.fromImage(image)
             self._original_pixmap = pixmap
+            self._scaled_cache = None  # новое изображение — старый масштаб неактуален
             self._update_preview_pixmap()
 
             # Обновляем метку с разрешением
@@ -1694,11 +2359,24 @@ class TagAutoCompleteApp(QMainWindow):
         if not self._original_pixmap:
             return
         target = QSize(self.image_label.width(), self.image_label.height())
+        mode = (
+            Qt.TransformationMode.FastTransformation
+            if self._resizing
+            else Qt.TransformationMode.SmoothTransformation
+        )
+        if (
+            self._scaled_cache is not None
+            and self._scaled_cache[0] == target
+            and self._scaled_cache[1] == mode
+        ):
+            self.image_label.setPixmap(self._scaled_cache[2])
+            return
         scaled = self._original_pixmap.scaled(
             target,
             Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+            mode,
         )
+        self._scaled_cache = (target, mode, scaled)
         self.image_label.setPixmap(scaled)
 
     def _recalc_image_label_min_size(self) -> None:
@@ -1789,8 +2467,30 @@ class TagAutoCompleteApp(QMainWindow):
 
     def build_image_list(self, folder: Path) -> None:
         try:
-            files = [p for p in sorted(folder.iterdir()) if p.suffix.lower() in IMAGE_EXTENSIONS]
-            self.image_list = files
+            # Папка не менялась — отдаём закэшированный список без
+            # повторного обхода каталога
+            mtime_ns = folder.stat().st_mtime_ns
+            cached = self._dir_cache.get(folder)
+            if cached is not None and cached[0] == mtime_ns:
+                self.image_list = list(cached[1])
+                logger.debug("Reused cached image list (%d items) for %s",
+                             len(self.image_list), folder)
+                return
+
+            # os.scandir отдаёт дешёвые DirEntry: фильтруем по имени и
+            # создаём Path-объекты только для подходящих файлов, вместо
+            # PosixPath + .suffix на каждый элемент каталога
+            with os.scandir(folder) as entries:
+                files = [
+                    folder / entry.name
+                    for entry in entries
+                    if not entry.is_dir(follow_symlinks=False)
+                    and (parts := entry.name.rpartition('.'))[0]
+                    and parts[2].lower() in IMAGE_EXT_SUFFIXES
+                ]
+            files.sort()
+            self._dir_cache[folder] = (mtime_ns, files)
+            self.image_list = list(files)
             logger.debug("Built image list with %d items from %s", len(files), folder)
         except Exception as exc:
             logger.exception("Error building image list: %s", exc)
@@ -1806,23 +2506,33 @@ class TagAutoCompleteApp(QMainWindow):
         index = max(0, min(index, len(self.image_list) - 1))
         path = self.image_list[index]
         
-        # Автосохраняем теги предыдущего изображения если они изменились
+        # Автосохраняем теги предыдущего изображения: откладываем запись
+        # в очередь вместо немедленного обращения к диску
         if self.current_image_path and self.current_image_path != path:
-            self.save_tags()
-        
-        reader = QImageReader(str(path))
-        reader.setAutoTransform(True)
-        image = reader.read()
-        if image.isNull():
-            logger.error("Cannot read image at %s", path)
-            return
+            self._queue_autosave()
+        
+        # Сначала кэш: при навигации по соседям изображение обычно уже
+        # декодировано фоновой предзагрузкой
+        cached = self._pixmap_cache.get(path)
+        if cached is not None:
+            self._pixmap_cache.move_to_end(path)
+            pixmap, width, height = cached
+        else:
+            reader = QImageReader(str(path))
+            reader.setAutoTransform(True)
+            image = reader.read()
+            if image.isNull():
+                logger.error("Cannot read image at %s", path)
+                return
+            width, height = image.width(), image.height()
+            pixmap = QPixmap.fromImage(image)
+            self._store_pixmap(path, pixmap, width, height)
 
         # Получаем и сохраняем размеры
-        width, height = image.width(), image.height()
         self.current_image_dimensions = (width, height)
 
-        pixmap = QPixmap.fromImage(image)
         self._original_pixmap = pixmap
+        self._scaled_cache = None  # новое изображение — старый масштаб неактуален
         self._update_preview_pixmap()
 
         # Обновляем метку с разрешением
@@ -1836,8 +2546,40 @@ class TagAutoCompleteApp(QMainWindow):
         self._auto_add_resolution_tags(width, height)
 
         self.update_nav_buttons()
+        # Соседние изображения декодируем заранее в фоне
+        self._prefetch_neighbors(index)
         logger.info("Switched to image %d: %s (%dx%d)", index + 1, path.name, width, height)
 
+    def _store_pixmap(self, path: Path, pixmap: QPixmap, width: int, height: int) -> None:
+        """Записать декодированное изображение в LRU-кэш."""
+        self._pixmap_cache[path] = (pixmap, width, height)
+        self._pixmap_cache.move_to_end(path)
+        while len(self._pixmap_cache) > PIXMAP_CACHE_MAX:
+            self._pixmap_cache.popitem(last=False)
+
+    def _prefetch_neighbors(self, index: int) -> None:
+        """Поставить соседние по списку изображения на фоновое декодирование."""
+        for neighbor in (index - 1, index + 1):
+            if not (0 <= neighbor < len(self.image_list)):
+                continue
+            path = self.image_list[neighbor]
+            if path in self._pixmap_cache or path in self._prefetch_pending:
+                continue
+            self._prefetch_pending.add(path)
+            QThreadPool.globalInstance().start(ImagePrefetchTask(self, path))
+
+    def _on_image_prefetched(self, path_str: str, image: QImage) -> None:
+        """Принять декодированный фоном QImage (GUI-поток).
+
+        Сигнал приходит и при неудачном декодировании: путь в любом случае
+        снимается с учёта, чтобы следующая навигация могла повторить
+        попытку (например, для файла, который ещё копировался).
+        """
+        path = Path(path_str)
+        self._prefetch_pending.discard(path)
+        if not image.isNull() and path not in self._pixmap_cache:
+            self._store_pixmap(path, QPixmap.fromImage(image), image.width(), image.height())
+
     @log_user_action("Navigate Next Image")
     def show_next_image(self) -> None:
         if self.current_index is None or not self.image_list:
@@ -1845,7 +2587,7 @@ class TagAutoCompleteApp(QMainWindow):
             return
         if self.current_index < len(self.image_list) - 1:
             next_index = self.current_index + 1
-            logger.debug(f"Navigating to next image: {next_index + 1}/{len(self.image_list)}")
+            logger.debug("Navigating to next image: %d/%d", next_index + 1, len(self.image_list))
             self.show_image_by_index(next_index)
         else:
             logger.debug("Navigation blocked: already at last image")
@@ -1857,7 +2599,7 @@ class TagAutoCompleteApp(QMainWindow):
             return
         if self.current_index > 0:
             prev_index = self.current_index - 1
-            logger.debug(f"Navigating to previous image: {prev_index + 1}/{len(self.image_list)}")
+            logger.debug("Navigating to previous image: %d/%d", prev_index + 1, len(self.image_list))
             self.show_image_by_index(prev_index)
         else:
             logger.debug("Navigation blocked: already at first image")
@@ -1912,31 +2654,42 @@ class TagAutoCompleteApp(QMainWindow):
             width: Ширина изображения в пикселях
             height: Высота изображения в пикселях
         """
-        # Получаем текущие теги
-        current_text = self.tag_input.toPlainText().strip()
-        tag_list = [tag.strip() for tag in current_text.split(',') if tag.strip()]
-        tag_list_lower = [tag.lower() for tag in tag_list]
-        
         # Считаем общее количество пикселей
         total_pixels = width * height
-        
-        # Определяем нужный тег на основе общего количества пикселей
-        new_tag = None
-        if total_pixels >= ABSURD_RES_THRESHOLD:
-            new_tag = "absurd resolution"
-        elif total_pixels >= HIGH_RES_THRESHOLD:
-            new_tag = "high res"
-        
-        # Добавляем тег если его еще нет
-        if new_tag and new_tag.lower() not in tag_list_lower:
-            tag_list.append(new_tag)
-            new_tags_text = ', '.join(tag_list)
-            self.tag_input.setPlainText(new_tags_text)
-            self.show_status(f"Tag added: {new_tag}", 2000)
-            logger.info(
-                "Auto-added resolution tag '%s' for %dx%d image (%.2f MP)",
-                new_tag, width, height, total_pixels / 1_000_000
-            )
+
+        # Определяем нужный тег без ветвлений: сумма двух сравнений даёт
+        # индекс в кортеже порогов (0 — без тега, 1 — high res, 2 — absurd)
+        new_tag = _RES_TAGS[
+            (total_pixels >= HIGH_RES_THRESHOLD) + (total_pixels >= ABSURD_RES_THRESHOLD)
+        ]
+        if not new_tag:
+            return
+
+        # Частый случай — тег уже стоит: один поиск в кэшированном
+        # множестве вместо трёх проходов по списку тегов
+        current_text = self._current_tag_text().strip()
+        if new_tag in self._tag_lower_set(current_text):
+            return
+
+        tag_list = self._parse_tags_from_text(current_text)
+        tag_list.append(new_tag)
+        new_tags_text = ', '.join(tag_list)
+        self.tag_input.setPlainText(new_tags_text)
+        self.show_status(f"Tag added: {new_tag}", 2000)
+        logger.info(
+            "Auto-added resolution tag '%s' for %dx%d image (%.2f MP)",
+            new_tag, width, height, total_pixels / 1_000_000
+        )
+
+    def _set_field_text(self, widget: QPlainTextEdit, text: str) -> None:
+        """Установить текст поля, только если он действительно изменился.
+
+        Повторный setPlainText с тем же содержимым заново гоняет layout
+        документа, undo-стек и каскад textChanged — при возврате к тому же
+        изображению всё это лишнее.
+        """
+        if widget.toPlainText() != text:
+            widget.setPlainText(text)
 
     def load_tags_from_file(self) -> None:
         """Загрузить теги и описание из файла или кэша."""
@@ -1944,12 +2697,24 @@ class TagAutoCompleteApp(QMainWindow):
             return
         
         image_path_str = str(self.current_image_path)
-        
+        txt_path = self.current_image_path.with_suffix(".txt")
+
+        # Возврат к изображению, чья запись ещё ждёт таймера автосохранения:
+        # сбрасываем очередь на диск до чтения и до раннего возврата из
+        # текстового кэша, чтобы отложенная запись не пережила просмотр
+        try:
+            dirty = self._dirty_paths
+        except (AttributeError, RuntimeError):
+            dirty = None
+        if dirty and txt_path in dirty:
+            self._flush_dirty()
+
         # Проверяем кэш сначала
         if image_path_str in self.text_cache:
             cached_data = self.text_cache[image_path_str]
-            self.tag_input.setPlainText(cached_data.get('tags', ''))
-            self.description_input.setPlainText(cached_data.get('description', ''))
+            self.text_cache.move_to_end(image_path_str)
+            self._set_field_text(self.tag_input, cached_data.get('tags', ''))
+            self._set_field_text(self.description_input, cached_data.get('description', ''))
             logger.info("Loaded cached text for %s", self.current_image_path.name)
             # курсор в конец
             cursor = self.tag_input.textCursor()
@@ -1957,34 +2722,31 @@ class TagAutoCompleteApp(QMainWindow):
             self.tag_input.setTextCursor(cursor)
             return
 
-        txt_path = self.current_image_path.with_suffix(".txt")
-        if txt_path.exists():
-            try:
-                with open(txt_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                
-                # Разделяем на теги и описание
-                if DESCRIPTION_SEPARATOR in content:
-                    parts = content.split(DESCRIPTION_SEPARATOR, 1)
-                    tags = parts[0].strip()
-                    description = parts[1].strip() if len(parts) > 1 else ""
-                else:
-                    # Обратная совместимость: файл без описания
-                    tags = content.strip()
-                    description = ""
-                
-                # Заполняем поля
-                self.tag_input.setPlainText(tags)
-                self.description_input.setPlainText(description)
-                logger.info("Loaded tags and description from %s", txt_path.name)
-            except Exception as exc:
-                logger.exception("Error loading tags: %s", exc)
-                self.show_status(f"Error loading tags: {exc}", 5000)
-                return
-        else:
-            self.tag_input.setPlainText("")
-            self.description_input.setPlainText("")
+        try:
+            # Сразу открываем без предварительного exists(): отсутствие файла
+            # ловится исключением, что экономит один stat на каждую навигацию
+            # Бинарное чтение одним вызовом + decode — без прослойки TextIOWrapper
+            with open(txt_path, "rb") as f:
+                content = f.read().decode("utf-8")
+        except FileNotFoundError:
+            self._set_field_text(self.tag_input, "")
+            self._set_field_text(self.description_input, "")
             logger.info("No tags file found for %s, fields cleared", self.current_image_path.name)
+        except Exception as exc:
+            logger.exception("Error loading tags: %s", exc)
+            self.show_status(f"Error loading tags: {exc}", 5000)
+            return
+        else:
+            # Разделяем на теги и описание одним partition (файл без
+            # разделителя — обратная совместимость, описание пустое)
+            head, sep, tail = content.partition(DESCRIPTION_SEPARATOR)
+            tags = head.strip()
+            description = tail.strip() if sep else ""
+
+            # Заполняем поля
+            self._set_field_text(self.tag_input, tags)
+            self._set_field_text(self.description_input, description)
+            logger.info("Loaded tags and description from %s", txt_path.name)
 
         cursor = self.tag_input.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
@@ -2002,16 +2764,20 @@ class TagAutoCompleteApp(QMainWindow):
             self.show_status("No image loaded to save tags for", 3000)
             return
 
-        tags = self.tag_input.toPlainText().strip()
+        tags = self._current_tag_text().strip()
         description = self.description_input.toPlainText().strip()
         txt_path = self.current_image_path.with_suffix(".txt")
 
         # Проверяем есть ли что сохранять
         if not tags and not description:
+            # Явное удаление перекрывает отложенную запись: иначе таймер
+            # автосохранения воскресил бы файл со старым содержимым
+            self._dirty_paths.pop(txt_path, None)
             # Если файл существовал ранее, удаляем его (теги были очищены)
             if txt_path.exists():
                 try:
                     txt_path.unlink()
+                    self._sidecar_hashes.pop(txt_path, None)
                     logger.info("Deleted empty tags file: %s", txt_path.name)
                 except Exception as exc:
                     logger.exception("Error deleting empty tags file: %s", exc)
@@ -2027,17 +2793,94 @@ class TagAutoCompleteApp(QMainWindow):
         if DEBUG_MODE:
             tag_count = len([tag.strip() for tag in tags.split(',') if tag.strip()])
             desc_lines = len(description.split('\n')) if description else 0
-            logger.debug(f"Saving {tag_count} tags and {desc_lines} description lines to {txt_path}")
+            logger.debug("Saving %d tags and %d description lines to %s", tag_count, desc_lines, txt_path)
 
         try:
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            logger.info("Tags and description saved to %s", txt_path)
+            if self._write_sidecar(txt_path, content):
+                logger.info("Tags and description saved to %s", txt_path)
+            # Явная запись перекрывает отложенную, если такая ждала таймера
+            self._dirty_paths.pop(txt_path, None)
             self.show_status(f"Tags saved to {txt_path.name}", 3000)
         except Exception as exc:
             logger.exception("Error saving tags: %s", exc)
             self.show_status(f"Error saving tags: {exc}", 5000)
 
+    def _queue_autosave(self) -> None:
+        """Поставить автосохранение текущего изображения в очередь записи.
+
+        Содержимое формируется сразу (поля ввода вот-вот перезапишутся
+        тегами следующего изображения), но на диск попадает пачкой из
+        _flush_dirty. None означает, что файл нужно удалить: теги были
+        очищены.
+        """
+        if not self.current_image_path:
+            return
+        tags = self._current_tag_text().strip()
+        description = self.description_input.toPlainText().strip()
+        txt_path = self.current_image_path.with_suffix(".txt")
+
+        if not tags and not description:
+            self._dirty_paths[txt_path] = None
+        elif description:
+            self._dirty_paths[txt_path] = f"{tags}\n{DESCRIPTION_SEPARATOR}\n{description}"
+        else:
+            self._dirty_paths[txt_path] = tags
+        self._flush_timer.start()
+
+    def _flush_dirty(self) -> None:
+        """Записать все отложенные автосохранения на диск."""
+        if not self._dirty_paths:
+            return
+        pending, self._dirty_paths = self._dirty_paths, {}
+        for txt_path, content in pending.items():
+            try:
+                if content is None:
+                    self._sidecar_hashes.pop(txt_path, None)
+                    try:
+                        txt_path.unlink()
+                        logger.info("Deleted empty tags file: %s", txt_path.name)
+                    except FileNotFoundError:
+                        pass
+                else:
+                    if self._write_sidecar(txt_path, content):
+                        logger.info("Tags and description saved to %s", txt_path)
+            except Exception as exc:
+                logger.exception("Error flushing autosave for %s: %s", txt_path, exc)
+
+    def _write_sidecar(self, txt_path: Path, content: str) -> bool:
+        """Атомарно записать sidecar-файл; False, если содержимое не менялось.
+
+        Запись идёт во временный файл в той же директории с последующим
+        os.replace: обрыв посреди записи не оставляет повреждённого файла.
+        Повторная запись того же текста (навигация без правок) распознаётся
+        по хешу и пропускается.
+        """
+        # Кодируем один раз: те же байты идут и в хеш, и на диск
+        data = content.encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+        if self._sidecar_hashes.get(txt_path) == digest:
+            return False
+        fd, tmp_name = tempfile.mkstemp(
+            dir=txt_path.parent, prefix=txt_path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, txt_path)
+        except Exception:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        self._sidecar_hashes[txt_path] = digest
+        return True
+
+    def closeEvent(self, event):  # pragma: no cover - GUI
+        """Гарантировать запись отложенных автосохранений при выходе."""
+        self._flush_dirty()
+        super().closeEvent(event)
+
     # ---------------- UX и стили ----------------
     def show_status(self, message: str, timeout: int = 0) -> None:
         """Показать сообщение в статус-баре (в миллисекундах).
@@ -2108,6 +2951,9 @@ class TagAutoCompleteApp(QMainWindow):
             msg.exec()
 
     def _apply_styles(self) -> None:
+        # Глобальный QSS применяется один раз в main() на уровне QApplication:
+        # повторный setStyleSheet заставил бы Qt заново парсить таблицу и
+        # инвалидировать кэш стилей всех виджетов.
         # Тёмная палитра для комфортного просмотра
         dark_palette = QPalette()
         dark_palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
@@ -2125,10 +2971,30 @@ class TagAutoCompleteApp(QMainWindow):
         app = QApplication.instance()
         if app:
             app.setPalette(dark_palette)
-            app.setStyleSheet(APP_STYLESHEET)
+            if not app.styleSheet():
+                app.setStyleSheet(APP_STYLESHEET)
 
     # ---------------- События окна ----------------
+    def changeEvent(self, event):  # pragma: no cover - GUI
+        # Смена шрифта приложения инвалидирует кэш метрик поля тегов
+        if event.type() == QEvent.Type.FontChange:
+            self._tag_input_char_width = None
+        return super().changeEvent(event)
+
     def resizeEvent(self, event):  # pragma: no cover - GUI
+        # Тяжёлый пересчёт уходит в debounce-таймер: при перетаскивании
+        # рамки события приходят на каждый пиксель, а пересчитывать размеры
+        # и превью достаточно после небольшой паузы. Пока ресайз идёт,
+        # превью обновляется дешёвым FastTransformation
+        self._resizing = True
+        self._update_preview_pixmap()
+        self._resize_timer.start()
+        return super().resizeEvent(event)
+
+    def _do_resize_recalc(self) -> None:  # pragma: no cover - GUI
+        """Отложенный пересчёт размеров после ресайза окна."""
+        # Перетаскивание закончилось — финальный прогон делаем плавным
+        self._resizing = False
         # Пересчитать целевой минимальный размер превью относительно текущего окна.
         # Высота превью — 90% от общей высоты окна, ширина — 70% от общей ширины окна.
         try:
@@ -2140,14 +3006,15 @@ class TagAutoCompleteApp(QMainWindow):
         self._update_preview_pixmap()
 
         # ограничиваем ширину поля для тегов примерно под 100 символов
-        fm = QFontMetrics(self.tag_input.font())
-        width_for_100 = fm.horizontalAdvance("0") * 100 + 32
+        if self._tag_input_char_width is None:
+            fm = QFontMetrics(self.tag_input.font())
+            self._tag_input_char_width = fm.horizontalAdvance("0")
+        width_for_100 = self._tag_input_char_width * 100 + 32
         max_allowed = int(self.width() * 0.45)
         target_width = min(width_for_100, max_allowed)
         self.tag_input.setMaximumWidth(target_width)
         # description_input тоже ограничиваем той же шириной
         self.description_input.setMaximumWidth(target_width)
-        return super().resizeEvent(event)
 
 
 # --------------------------- Парсинг аргументов командной строки -----------------------------------
@@ -2199,6 +3066,8 @@ def main() -> None:
     try:
         app = QApplication(sys.argv)
         app.setStyle("Fusion")
+        # Единственное применение глобального QSS — один парсинг таблицы стилей
+        app.setStyleSheet(APP_STYLESHEET)
         window = TagAutoCompleteApp()
         window.show()
         
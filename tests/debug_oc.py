@@ -1,23 +1,25 @@
 #!/usr/bin/env python3
 """Диагностика проблемы с тегом 'oc'."""
 
-import pandas as pd
+from itertools import islice
 from pathlib import Path
 
+import pandas as pd
+
 def debug_oc_tag():
     """Проверить, где именно находится тег 'oc' в данных."""
     
     # Загружаем данные
-    csv_path = Path('test_derpibooru.csv')
+    csv_path = Path(__file__).parent / 'test_derpibooru.csv'
     if not csv_path.exists():
         print("CSV файл не найден!")
         return
         
     # Сначала смотрим сырые строки
     print("=== СЫРЫЕ СТРОКИ ===")
+    # islice читает только нужный префикс файла вместо readlines() целиком
     with open(csv_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-        for i, line in enumerate(lines[:10]):
+        for i, line in enumerate(islice(f, 10)):
             print(f"Строка {i}: {repr(line.strip())}")
     
     print("\n=== PANDAS PARSING ===")
@@ -33,42 +35,43 @@ def debug_oc_tag():
     # Ищем строки с тегом 'oc'
     oc_rows = df[df.iloc[:, 0] == 'oc']
     print(f"\nСтроки с точным тегом 'oc': {len(oc_rows)}")
-    for idx, row in oc_rows.iterrows():
-        print(f"  Строка {idx}: {list(row)}")
+    for idx, *cells in oc_rows.itertuples(name=None):
+        print(f"  Строка {idx}: {cells}")
     
     # Ищем строки, которые начинаются с 'oc'
     oc_prefix_rows = df[df.iloc[:, 0].str.startswith('oc', na=False)]
     print(f"\nСтроки, начинающиеся с 'oc': {len(oc_prefix_rows)}")
-    for idx, row in oc_prefix_rows.head(10).iterrows():
-        print(f"  Строка {idx}: {row.iloc[0]} -> {list(row)}")
+    for idx, *cells in oc_prefix_rows.head(10).itertuples(name=None):
+        print(f"  Строка {idx}: {cells[0]} -> {cells}")
     
     # Проверяем обработку тегов
     tag_freq_map = {}
     
-    for idx, row in df.iterrows():
-        if len(row) < 3:
+    # itertuples вместо iterrows: обычные кортежи без создания Series на строку
+    for idx, *cells in df.itertuples(name=None):
+        if len(cells) < 3:
             continue
-            
+
         # Основной тег
-        main_tag = str(row.iloc[0]).strip()
+        main_tag = str(cells[0]).strip()
         if main_tag:
             try:
-                frequency = int(row.iloc[2]) if str(row.iloc[2]).isdigit() else 0
+                frequency = int(cells[2]) if str(cells[2]).isdigit() else 0
                 tag_freq_map[main_tag] = frequency
                 if main_tag == 'oc':
                     print(f"Найден тег 'oc' в строке {idx} с частотой {frequency}")
             except (ValueError, IndexError):
                 tag_freq_map[main_tag] = 0
-        
+
         # Альтернативные теги
-        if len(row) >= 4 and str(row.iloc[3]).strip():
-            alternatives = str(row.iloc[3]).strip()
+        if len(cells) >= 4 and str(cells[3]).strip():
+            alternatives = str(cells[3]).strip()
             if alternatives:
                 for alt_tag in alternatives.split(","):
                     alt_tag = alt_tag.strip()
                     if alt_tag and alt_tag not in tag_freq_map:
                         try:
-                            base_freq = int(row.iloc[2]) if str(row.iloc[2]).isdigit() else 0
+                            base_freq = int(cells[2]) if str(cells[2]).isdigit() else 0
                             tag_freq_map[alt_tag] = max(1, base_freq // 2)
                             if alt_tag == 'oc':
                                 print(f"Найден альтернативный тег 'oc' с частотой {tag_freq_map[alt_tag]}")
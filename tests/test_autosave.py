@@ -11,8 +11,9 @@ import io
 # Добавляем src в путь
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-# Устанавливаем UTF-8 кодировку для вывода в Windows
-if sys.platform == 'win32':
+# Устанавливаем UTF-8 кодировку для вывода в Windows (только если
+# поток ещё не в UTF-8 — лишняя обёртка не создаётся)
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 from main import DESCRIPTION_SEPARATOR
@@ -22,18 +23,41 @@ class TestAutoSaveOnSwitch:
     """Тесты автосохранения при переключении изображений."""
 
     def __init__(self):
+        # Одна базовая временная директория на класс: каждый тест получает
+        # свежую поддиректорию, а rmtree выполняется один раз в cleanup()
+        self.base_dir = Path(tempfile.mkdtemp())
+        self._case_no = 0
         self.temp_dir = None
+        self.qapp = None
+        self.window = None
+
+    def get_window(self):
+        """Одно окно приложения на все тесты (повторное создание
+        и разрушение QMainWindow в одном процессе нестабильно в Qt)."""
+        if self.window is None:
+            from PyQt6.QtWidgets import QApplication
+            from main import TagAutoCompleteApp
+
+            self.qapp = QApplication.instance() or QApplication([])
+            self.window = TagAutoCompleteApp()
+        return self.window
 
     def setup(self):
-        """Создание временной директории."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        """Создание временной поддиректории для теста."""
+        self._case_no += 1
+        self.temp_dir = self.base_dir / f"case_{self._case_no}"
+        self.temp_dir.mkdir()
         print(f"Создана временная директория: {self.temp_dir}")
 
     def teardown(self):
-        """Очистка временной директории."""
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-            print(f"Временная директория удалена: {self.temp_dir}")
+        """Поддиректория живёт до общей очистки в cleanup()."""
+        self.temp_dir = None
+
+    def cleanup(self):
+        """Удаление базовой временной директории (один раз за прогон)."""
+        if self.base_dir.exists():
+            shutil.rmtree(self.base_dir, ignore_errors=True)
+            print(f"Временная директория удалена: {self.base_dir}")
 
     def test_file_format(self):
         """Проверка формата файла с тегами и описанием."""
@@ -176,6 +200,105 @@ class TestAutoSaveOnSwitch:
         finally:
             self.teardown()
 
+    def test_batched_flush(self):
+        """Проверка отложенной пакетной записи автосохранения."""
+        self.setup()
+        try:
+            window = self.get_window()
+
+            img_path = self.temp_dir / "image.png"
+            img_path.touch()
+            img_txt = self.temp_dir / "image.txt"
+
+            # Редактируем теги и ставим автосохранение в очередь
+            window.current_image_path = img_path
+            window.tag_input.setPlainText("tag1, tag2")
+            window._queue_autosave()
+
+            # Запись отложена: на диске ещё ничего нет
+            assert not img_txt.exists()
+            assert img_txt in window._dirty_paths
+
+            # Повторная постановка не множит записи — та же запись в словаре
+            window._queue_autosave()
+            assert len(window._dirty_paths) == 1
+
+            # Флаш записывает содержимое и очищает очередь
+            window._flush_dirty()
+            assert not window._dirty_paths
+            with open(img_txt, "r", encoding="utf-8") as f:
+                assert f.read() == "tag1, tag2"
+
+            # Очистка тегов ставит удаление файла в очередь
+            window.tag_input.setPlainText("")
+            window._queue_autosave()
+            window._flush_dirty()
+            assert not img_txt.exists()
+
+            window.current_image_path = None
+            print("OK: Отложенная пакетная запись работает корректно")
+        finally:
+            self.teardown()
+
+    def test_idempotent_write(self):
+        """Проверка атомарной записи и пропуска неизменённого содержимого."""
+        self.setup()
+        try:
+            window = self.get_window()
+
+            txt_path = self.temp_dir / "image.txt"
+
+            # Первая запись создаёт файл
+            assert window._write_sidecar(txt_path, "tag1, tag2") is True
+            assert txt_path.read_text(encoding="utf-8") == "tag1, tag2"
+            mtime_first = txt_path.stat().st_mtime_ns
+
+            # Повторная запись того же содержимого пропускается
+            assert window._write_sidecar(txt_path, "tag1, tag2") is False
+            assert txt_path.stat().st_mtime_ns == mtime_first
+
+            # Новое содержимое записывается
+            assert window._write_sidecar(txt_path, "tag1, tag2, tag3") is True
+            assert txt_path.read_text(encoding="utf-8") == "tag1, tag2, tag3"
+
+            # Временных файлов после записи не остаётся
+            leftovers = [p for p in self.temp_dir.iterdir() if p.suffix == ".tmp"]
+            assert not leftovers
+
+            print("OK: Атомарная запись пропускает неизменённое содержимое")
+        finally:
+            self.teardown()
+
+    def test_explicit_delete_cancels_pending(self):
+        """Проверка что явное удаление отменяет отложенную запись."""
+        self.setup()
+        try:
+            window = self.get_window()
+
+            img_path = self.temp_dir / "image.png"
+            img_path.touch()
+            img_txt = self.temp_dir / "image.txt"
+
+            # Правка ставит автосохранение в очередь
+            window.current_image_path = img_path
+            window.tag_input.setPlainText("tag1, tag2")
+            window._queue_autosave()
+            assert img_txt in window._dirty_paths
+
+            # Пользователь очищает поля и сохраняет явно: отложенная
+            # запись не должна воскресить файл со старыми тегами
+            window.tag_input.setPlainText("")
+            window.description_input.setPlainText("")
+            window.save_tags()
+            assert img_txt not in window._dirty_paths
+            window._flush_dirty()
+            assert not img_txt.exists()
+
+            window.current_image_path = None
+            print("OK: Явное удаление отменяет отложенную запись")
+        finally:
+            self.teardown()
+
 
 def run_tests():
     """Запуск тестов автосохранения."""
@@ -192,11 +315,16 @@ def run_tests():
         test.test_no_empty_file_created()
         test.test_delete_empty_file_on_clear()
         test.test_autosave_logic()
+        test.test_batched_flush()
+        test.test_idempotent_write()
+        test.test_explicit_delete_cancels_pending()
     except Exception as e:
         print(f"FAIL: {type(e).__name__}: {e}")
         import traceback
         traceback.print_exc()
         all_passed = False
+    finally:
+        test.cleanup()
     
     print()
     print("=" * 70)
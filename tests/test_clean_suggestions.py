@@ -24,7 +24,7 @@ def test_clean_suggestions():
     app.tag_cache = {}
     
     # Загружаем чистый тестовый CSV
-    test_csv = Path('test_clean.csv')
+    test_csv = Path(__file__).parent / 'test_clean.csv'
     if not test_csv.exists():
         print("❌ Файл test_clean.csv не найден!")
         return False
@@ -9,6 +9,7 @@
 4. Перевод интерфейса (Этап 4)
 """
 
+import re
 import sys
 import tempfile
 import shutil
@@ -18,8 +19,9 @@ import io
 # Добавляем src в путь
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-# Устанавливаем UTF-8 кодировку для вывода в Windows
-if sys.platform == 'win32':
+# Устанавливаем UTF-8 кодировку для вывода в Windows (только если
+# поток ещё не в UTF-8 — лишняя обёртка не создаётся)
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 from main import (
@@ -28,6 +30,10 @@ from main import (
     ABSURD_RES_THRESHOLD,
 )
 
+# Предкомпилированный поиск кириллицы: одна C-проверка вместо
+# посимвольного Python-цикла в каждом тесте перевода
+_CYRILLIC_SEARCH = re.compile(r'[\u0400-\u04FF]').search
+
 
 class TestDescriptionField:
     """Тесты для поля описания (Этап 2)."""
@@ -236,7 +242,7 @@ class TestInterfaceTranslation:
         for string, description in ui_strings.items():
             assert isinstance(string, str)
             # Проверяем что строка не содержит кириллицы (кроме комментариев)
-            has_cyrillic = any('\u0400' <= c <= '\u04FF' for c in string)
+            has_cyrillic = _CYRILLIC_SEARCH(string) is not None
             assert not has_cyrillic, f"UI строка содержит кириллицу: {string}"
         
         print("OK: Все UI строки на английском языке")
@@ -250,7 +256,7 @@ class TestInterfaceTranslation:
         ]
         
         for title in dialog_titles:
-            has_cyrillic = any('\u0400' <= c <= '\u04FF' for c in title)
+            has_cyrillic = _CYRILLIC_SEARCH(title) is not None
             assert not has_cyrillic, f"Заголовок диалога содержит кириллицу: {title}"
         
         print("OK: Заголовки диалогов на английском языке")
@@ -264,7 +270,7 @@ class TestInterfaceTranslation:
         ]
         
         for label in button_labels:
-            has_cyrillic = any('\u0400' <= c <= '\u04FF' for c in label)
+            has_cyrillic = _CYRILLIC_SEARCH(label) is not None
             assert not has_cyrillic, f"Надпись кнопки содержит кириллицу: {label}"
         
         print("OK: Надписи кнопок на английском языке")
@@ -274,18 +280,28 @@ class TestFileOperations:
     """Тесты для операций с файлами."""
 
     def __init__(self):
+        # Одна базовая временная директория на класс: каждый тест получает
+        # свежую поддиректорию, а rmtree выполняется один раз в cleanup()
+        self.base_dir = Path(tempfile.mkdtemp())
+        self._case_no = 0
         self.temp_dir = None
 
     def setup(self):
-        """Создание временной директории."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        """Создание временной поддиректории для теста."""
+        self._case_no += 1
+        self.temp_dir = self.base_dir / f"case_{self._case_no}"
+        self.temp_dir.mkdir()
         print(f"Создана временная директория: {self.temp_dir}")
 
     def teardown(self):
-        """Очистка временной директории."""
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-            print(f"Временная директория удалена: {self.temp_dir}")
+        """Поддиректория живёт до общей очистки в cleanup()."""
+        self.temp_dir = None
+
+    def cleanup(self):
+        """Удаление базовой временной директории (один раз за прогон)."""
+        if self.base_dir.exists():
+            shutil.rmtree(self.base_dir, ignore_errors=True)
+            print(f"Временная директория удалена: {self.base_dir}")
 
     def test_save_and_load_with_description(self):
         """Проверка сохранения и загрузки с описанием."""
@@ -297,12 +313,10 @@ class TestFileOperations:
             
             # Сохранение
             content = f"{tags}\n{DESCRIPTION_SEPARATOR}\n{description}"
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            txt_path.write_bytes(content.encode("utf-8"))
             
             # Загрузка
-            with open(txt_path, "r", encoding="utf-8") as f:
-                read_content = f.read()
+            read_content = txt_path.read_bytes().decode("utf-8")
             
             if DESCRIPTION_SEPARATOR in read_content:
                 parts = read_content.split(DESCRIPTION_SEPARATOR, 1)
@@ -323,12 +337,10 @@ class TestFileOperations:
             tags = "tag1, tag2, tag3"
             
             # Сохранение (без описания)
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(tags)
+            txt_path.write_bytes(tags.encode("utf-8"))
             
             # Загрузка
-            with open(txt_path, "r", encoding="utf-8") as f:
-                read_content = f.read()
+            read_content = txt_path.read_bytes().decode("utf-8")
             
             assert DESCRIPTION_SEPARATOR not in read_content
             assert read_content.strip() == tags
@@ -414,6 +426,8 @@ def run_all_tests():
     except Exception as e:
         print(f"FAIL: {e}")
         all_passed = False
+    finally:
+        test_file.cleanup()
     print()
     
     # Итоговый результат
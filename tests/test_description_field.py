@@ -14,8 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 from main import DESCRIPTION_SEPARATOR
 
 
-# Устанавливаем UTF-8 кодировку для вывода в Windows
-if sys.platform == 'win32':
+# Устанавливаем UTF-8 кодировку для вывода в Windows (только если
+# поток ещё не в UTF-8 — лишняя обёртка не создаётся)
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 
@@ -40,10 +41,11 @@ class TestDescriptionSeparator:
         """Проверка разделения содержимого на теги и описание."""
         content = f"tag1, tag2, artist:name\n{DESCRIPTION_SEPARATOR}\nЭто описание изображения"
         
-        if DESCRIPTION_SEPARATOR in content:
-            parts = content.split(DESCRIPTION_SEPARATOR, 1)
-            tags = parts[0].strip()
-            description = parts[1].strip()
+        # partition находит разделитель и режет строку одним проходом
+        head, sep, tail = content.partition(DESCRIPTION_SEPARATOR)
+        if sep:
+            tags = head.strip()
+            description = tail.strip()
             
             assert tags == "tag1, tag2, artist:name"
             assert description == "Это описание изображения"
@@ -65,9 +67,9 @@ class TestDescriptionSeparator:
         """Проверка многострочного описания."""
         content = f"tag1, tag2\n{DESCRIPTION_SEPARATOR}\nПервая строка\nВторая строка\nТретья строка"
         
-        parts = content.split(DESCRIPTION_SEPARATOR, 1)
-        tags = parts[0].strip()
-        description = parts[1].strip()
+        head, _sep, tail = content.partition(DESCRIPTION_SEPARATOR)
+        tags = head.strip()
+        description = tail.strip()
         
         assert tags == "tag1, tag2"
         assert description == "Первая строка\nВторая строка\nТретья строка"
@@ -116,12 +118,10 @@ class TestFileOperations:
             
             content = f"{tags}\n{DESCRIPTION_SEPARATOR}\n{description}"
             
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            txt_path.write_bytes(content.encode("utf-8"))
             
             # Читаем и проверяем
-            with open(txt_path, "r", encoding="utf-8") as f:
-                read_content = f.read()
+            read_content = txt_path.read_bytes().decode("utf-8")
             
             assert read_content == content
             print("✅ Сохранение файла с описанием работает корректно")
@@ -136,17 +136,15 @@ class TestFileOperations:
             
             # Создаём файл с описанием
             content = f"tag1, tag2\n{DESCRIPTION_SEPARATOR}\nОписание изображения"
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            txt_path.write_bytes(content.encode("utf-8"))
             
             # Загружаем и разделяем
-            with open(txt_path, "r", encoding="utf-8") as f:
-                read_content = f.read()
+            read_content = txt_path.read_bytes().decode("utf-8")
             
-            if DESCRIPTION_SEPARATOR in read_content:
-                parts = read_content.split(DESCRIPTION_SEPARATOR, 1)
-                tags = parts[0].strip()
-                description = parts[1].strip()
+            head, sep, tail = read_content.partition(DESCRIPTION_SEPARATOR)
+            if sep:
+                tags = head.strip()
+                description = tail.strip()
                 
                 assert tags == "tag1, tag2"
                 assert description == "Описание изображения"
@@ -162,20 +160,14 @@ class TestFileOperations:
             
             # Создаём файл без описания (старый формат)
             content = "tag1, tag2, tag3"
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            txt_path.write_bytes(content.encode("utf-8"))
             
             # Загружаем и разделяем
-            with open(txt_path, "r", encoding="utf-8") as f:
-                read_content = f.read()
+            read_content = txt_path.read_bytes().decode("utf-8")
             
-            if DESCRIPTION_SEPARATOR not in read_content:
-                tags = read_content.strip()
-                description = ""
-            else:
-                parts = read_content.split(DESCRIPTION_SEPARATOR, 1)
-                tags = parts[0].strip()
-                description = parts[1].strip()
+            head, sep, tail = read_content.partition(DESCRIPTION_SEPARATOR)
+            tags = head.strip()
+            description = tail.strip() if sep else ""
             
             assert tags == "tag1, tag2, tag3"
             assert description == ""
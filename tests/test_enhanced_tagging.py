@@ -317,34 +317,38 @@ def test_comprehensive_workflow():
     
     print("✓ Comprehensive workflow test passed")
 
+_BIG_TAG_DB = None
+
+
+def _get_big_tag_db():
+    """Build the large mock tag database once and reuse it across runs."""
+    global _BIG_TAG_DB
+    if _BIG_TAG_DB is None:
+        test_tags = ['female', 'female_oc', 'safe', 'rainbow_dash']
+        tags = test_tags + [f"test_tag_{i:04d}" for i in range(10000)]
+        freqs = {tag: 1000000 for tag in test_tags}
+        freqs.update((f"test_tag_{i:04d}", 10000 - i) for i in range(10000))
+        _BIG_TAG_DB = (tags, freqs)
+    return _BIG_TAG_DB
+
+
 def test_performance_considerations():
     """Test performance aspects of the enhanced system."""
     print("Testing performance considerations...")
     
-    from main import TagAutoCompleteApp
+    from main import TagAutoCompleteApp, MAX_SUGGESTIONS
     import time
     
     # Create app with large tag database
     app = Mock()
     
-    # Simulate large tag database (10,000 tags)
-    app.all_tags = []
-    app.all_tags_lower = []
-    app.tag_frequencies = {}
-    
-    for i in range(10000):
-        tag = f"test_tag_{i:04d}"
-        app.all_tags.append(tag)
-        app.all_tags_lower.append(tag.lower())
-        app.tag_frequencies[tag] = 10000 - i  # Decreasing frequency
-    
-    # Add some test targets
-    test_tags = ['female', 'female_oc', 'safe', 'rainbow_dash']
-    for tag in test_tags:
-        app.all_tags.insert(0, tag)
-        app.all_tags_lower.insert(0, tag.lower())
-        app.tag_frequencies[tag] = 1000000
-    
+    # Simulate large tag database (10,000 tags) - built once per process
+    tags, freqs = _get_big_tag_db()
+    app.all_tags = list(tags)
+    # All generated tags are already lowercase - reuse the same list
+    app.all_tags_lower = app.all_tags
+    app.tag_frequencies = freqs
+
     app.tag_cache = {}
     
     # Test search performance
@@ -354,7 +358,7 @@ def test_performance_considerations():
     queries = ['fe', 'sa', 'rain', 'test', 'female']
     for query in queries:
         suggestions = TagAutoCompleteApp.find_suggestions(app, query)
-        assert len(suggestions) <= 5, f"Too many suggestions returned: {len(suggestions)}"
+        assert len(suggestions) <= MAX_SUGGESTIONS, f"Too many suggestions returned: {len(suggestions)}"
     
     end_time = time.time()
     elapsed = end_time - start_time
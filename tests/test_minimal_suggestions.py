@@ -24,7 +24,7 @@ def test_minimal_suggestions():
     app.tag_cache = {}
     
     # Загружаем минимальный тестовый CSV
-    test_csv = Path('test_minimal.csv')
+    test_csv = Path(__file__).parent / 'test_minimal.csv'
     if not test_csv.exists():
         print("❌ Файл test_minimal.csv не найден!")
         return False
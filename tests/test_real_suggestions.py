@@ -25,7 +25,7 @@ def test_real_suggestions():
     app.tag_cache = {}
     
     # Загружаем тестовые данные с правильным парсингом
-    test_csv = Path('test_derpibooru.csv')
+    test_csv = Path(__file__).parent / 'test_derpibooru.csv'
     if not test_csv.exists():
         print("❌ Тестовый файл test_derpibooru.csv не найден!")
         return False
@@ -14,8 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 from main import HIGH_RES_THRESHOLD, ABSURD_RES_THRESHOLD
 
 
-# Устанавливаем UTF-8 кодировку для вывода в Windows
-if sys.platform == 'win32':
+# Устанавливаем UTF-8 кодировку для вывода в Windows (только если
+# поток ещё не в UTF-8 — лишняя обёртка не создаётся)
+if sys.platform == 'win32' and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8'):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 